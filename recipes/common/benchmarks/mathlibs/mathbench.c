@@ -0,0 +1,272 @@
+/*
+ * Micro-benchmarks of the math libraries of a uenv, run by
+ * workflow/util/mathlibs-benchmark.py to choose the providers of a recipe:
+ *
+ *   dgemm    BLAS        C = A B of n x n double matrices
+ *   zheevd   LAPACK      eigenvalues and eigenvectors of an n x n Hermitian matrix
+ *   pdsyevd  ScaLAPACK   eigenvalues and eigenvectors of an n x n symmetric matrix, on all ranks
+ *   fft      FFTW API    3D complex to complex FFT of n x n x n points
+ *
+ * The program is built once per kernel and provider, with -DMATHBENCH_<KERNEL>,
+ * and -DMATHBENCH_FFTW_THREADS when the FFT library has the FFTW threads API.
+ *
+ *   mathbench <n> <repeat>
+ *
+ * runs the kernel once to warm up, then <repeat> times, and prints the median
+ * time, and the rate for the kernels with a standard operation count:
+ *
+ *   mathbench dgemm n=4096 time=0.123456 gflops=1113.2
+ */
+
+#include <complex.h>
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#if defined(MATHBENCH_PDSYEVD)
+#include <mpi.h>
+#else
+#include <omp.h>
+#endif
+
+#if defined(MATHBENCH_FFT)
+#include <fftw3.h>
+#endif
+
+static int compare(const void* a, const void* b) {
+    double x = *(const double*)a, y = *(const double*)b;
+    return (x > y) - (x < y);
+}
+
+static double median(double* times, int count) {
+    qsort(times, count, sizeof(double), compare);
+    return count % 2 ? times[count / 2] : 0.5 * (times[count / 2 - 1] + times[count / 2]);
+}
+
+static double now(void) {
+#if defined(MATHBENCH_PDSYEVD)
+    return MPI_Wtime();
+#else
+    return omp_get_wtime();
+#endif
+}
+
+#if defined(MATHBENCH_DGEMM)
+
+void dgemm_(const char* transa, const char* transb, const int* m, const int* n, const int* k,
+            const double* alpha, const double* a, const int* lda, const double* b, const int* ldb,
+            const double* beta, double* c, const int* ldc);
+
+static const char* kernel = "dgemm";
+
+static double flops(int n) { return 2.0 * n * n * n; }
+
+static void* setup(int n) {
+    double* data = malloc(3 * (size_t)n * n * sizeof(double));
+    for (size_t i = 0; i < 3 * (size_t)n * n; ++i) data[i] = (double)(i % 17) / 17.0 - 0.5;
+    return data;
+}
+
+static void run(void* state, int n) {
+    double* a = state;
+    double *b = a + (size_t)n * n, *c = b + (size_t)n * n;
+    const double alpha = 1.0, beta = 0.0;
+    dgemm_("N", "N", &n, &n, &n, &alpha, a, &n, b, &n, &beta, c, &n);
+}
+
+#elif defined(MATHBENCH_ZHEEVD)
+
+void zheevd_(const char* jobz, const char* uplo, const int* n, double complex* a, const int* lda,
+             double* w, double complex* work, const int* lwork, double* rwork, const int* lrwork,
+             int* iwork, const int* liwork, int* info);
+
+static const char* kernel = "zheevd";
+
+static double flops(int n) { return 0.0; }
+
+struct zheevd_state {
+    double complex *matrix, *a, *work;
+    double *w, *rwork;
+    int *iwork, lwork, lrwork, liwork;
+};
+
+static void* setup(int n) {
+    struct zheevd_state* s = malloc(sizeof(*s));
+    s->matrix = malloc((size_t)n * n * sizeof(double complex));
+    s->a = malloc((size_t)n * n * sizeof(double complex));
+    s->w = malloc(n * sizeof(double));
+    /* a Hermitian matrix: symmetric real part, antisymmetric imaginary part */
+    for (int j = 0; j < n; ++j)
+        for (int i = 0; i < n; ++i)
+            s->matrix[(size_t)j * n + i] = cos(0.01 * (i + 1) * (j + 1)) + (i == j ? n : 0) + I * 0.001 * (i - j);
+
+    double complex work;
+    double rwork;
+    int iwork, info, query = -1;
+    zheevd_("V", "L", &n, s->a, &n, s->w, &work, &query, &rwork, &query, &iwork, &query, &info);
+    s->lwork = (int)creal(work);
+    s->lrwork = (int)rwork;
+    s->liwork = iwork;
+    s->work = malloc((size_t)s->lwork * sizeof(double complex));
+    s->rwork = malloc((size_t)s->lrwork * sizeof(double));
+    s->iwork = malloc((size_t)s->liwork * sizeof(int));
+    return s;
+}
+
+static void run(void* state, int n) {
+    struct zheevd_state* s = state;
+    int info;
+    memcpy(s->a, s->matrix, (size_t)n * n * sizeof(double complex));
+    zheevd_("V", "L", &n, s->a, &n, s->w, s->work, &s->lwork, s->rwork, &s->lrwork, s->iwork, &s->liwork,
+            &info);
+    if (info != 0) {
+        fprintf(stderr, "zheevd failed: info=%d\n", info);
+        exit(1);
+    }
+}
+
+#elif defined(MATHBENCH_PDSYEVD)
+
+void Cblacs_get(int context, int what, int* value);
+void Cblacs_gridinit(int* context, const char* order, int rows, int cols);
+void Cblacs_gridinfo(int context, int* rows, int* cols, int* row, int* col);
+void Cblacs_gridexit(int context);
+int numroc_(const int* n, const int* nb, const int* iproc, const int* isrcproc, const int* nprocs);
+void descinit_(int* desc, const int* m, const int* n, const int* mb, const int* nb, const int* irsrc,
+               const int* icsrc, const int* context, const int* lld, int* info);
+void pdsyevd_(const char* jobz, const char* uplo, const int* n, double* a, const int* ia, const int* ja,
+              const int* desca, double* w, double* z, const int* iz, const int* jz, const int* descz,
+              double* work, const int* lwork, int* iwork, const int* liwork, int* info);
+
+static const char* kernel = "pdsyevd";
+
+static double flops(int n) { return 0.0; }
+
+static const int block = 64;
+
+struct pdsyevd_state {
+    int context, rows, cols, lld, desc[9], lwork, liwork, *iwork;
+    double *matrix, *a, *z, *w, *work;
+    size_t size;
+};
+
+static void* setup(int n) {
+    struct pdsyevd_state* s = malloc(sizeof(*s));
+    int ranks, row, col, zero = 0, one = 1, info;
+    MPI_Comm_size(MPI_COMM_WORLD, &ranks);
+    /* the most square grid of the ranks */
+    int rows = (int)sqrt((double)ranks);
+    while (ranks % rows) --rows;
+    Cblacs_get(-1, 0, &s->context);
+    Cblacs_gridinit(&s->context, "Row", rows, ranks / rows);
+    Cblacs_gridinfo(s->context, &s->rows, &s->cols, &row, &col);
+
+    int local_rows = numroc_(&n, &block, &row, &zero, &s->rows);
+    int local_cols = numroc_(&n, &block, &col, &zero, &s->cols);
+    s->lld = local_rows > 1 ? local_rows : 1;
+    descinit_(s->desc, &n, &n, &block, &block, &zero, &zero, &s->context, &s->lld, &info);
+    s->size = (size_t)s->lld * local_cols;
+    s->matrix = malloc(s->size * sizeof(double));
+    s->a = malloc(s->size * sizeof(double));
+    s->z = malloc(s->size * sizeof(double));
+    s->w = malloc(n * sizeof(double));
+    /* a symmetric matrix, from the global indices of the local elements */
+    for (int lj = 0; lj < local_cols; ++lj) {
+        int j = ((lj / block) * s->cols + col) * block + lj % block;
+        for (int li = 0; li < local_rows; ++li) {
+            int i = ((li / block) * s->rows + row) * block + li % block;
+            s->matrix[(size_t)lj * s->lld + li] = cos(0.01 * (i + 1) * (j + 1)) + (i == j ? n : 0);
+        }
+    }
+
+    double work;
+    int iwork, query = -1;
+    pdsyevd_("V", "L", &n, s->a, &one, &one, s->desc, s->w, s->z, &one, &one, s->desc, &work, &query, &iwork,
+             &query, &info);
+    s->lwork = (int)work;
+    s->liwork = iwork;
+    s->work = malloc((size_t)s->lwork * sizeof(double));
+    s->iwork = malloc((size_t)s->liwork * sizeof(int));
+    return s;
+}
+
+static void run(void* state, int n) {
+    struct pdsyevd_state* s = state;
+    int one = 1, info;
+    memcpy(s->a, s->matrix, s->size * sizeof(double));
+    MPI_Barrier(MPI_COMM_WORLD);
+    pdsyevd_("V", "L", &n, s->a, &one, &one, s->desc, s->w, s->z, &one, &one, s->desc, s->work, &s->lwork,
+             s->iwork, &s->liwork, &info);
+    if (info != 0) {
+        fprintf(stderr, "pdsyevd failed: info=%d\n", info);
+        MPI_Abort(MPI_COMM_WORLD, 1);
+    }
+    MPI_Barrier(MPI_COMM_WORLD);
+}
+
+#elif defined(MATHBENCH_FFT)
+
+static const char* kernel = "fft";
+
+static double flops(int n) {
+    double points = (double)n * n * n;
+    return 5.0 * points * log2(points);
+}
+
+static void* setup(int n) {
+#if defined(MATHBENCH_FFTW_THREADS)
+    fftw_init_threads();
+    fftw_plan_with_nthreads(omp_get_max_threads());
+#endif
+    size_t points = (size_t)n * n * n;
+    fftw_complex* in = fftw_malloc(points * sizeof(fftw_complex));
+    fftw_complex* out = fftw_malloc(points * sizeof(fftw_complex));
+    /* planning with FFTW_MEASURE overwrites the arrays, which are initialized afterwards */
+    fftw_plan plan = fftw_plan_dft_3d(n, n, n, in, out, FFTW_FORWARD, FFTW_MEASURE);
+    /* fftw_complex is double complex, as complex.h is included before fftw3.h */
+    for (size_t i = 0; i < points; ++i) in[i] = (double)(i % 13) / 13.0;
+    fftw_plan* state = malloc(sizeof(fftw_plan));
+    *state = plan;
+    return state;
+}
+
+static void run(void* state, int n) { fftw_execute(*(fftw_plan*)state); }
+
+#else
+#error "define one of MATHBENCH_DGEMM, MATHBENCH_ZHEEVD, MATHBENCH_PDSYEVD or MATHBENCH_FFT"
+#endif
+
+int main(int argc, char** argv) {
+    int rank = 0;
+#if defined(MATHBENCH_PDSYEVD)
+    MPI_Init(&argc, &argv);
+    MPI_Comm_rank(MPI_COMM_WORLD, &rank);
+#endif
+    if (argc != 3) {
+        fprintf(stderr, "usage: %s <n> <repeat>\n", argv[0]);
+        return 1;
+    }
+    int n = atoi(argv[1]), repeat = atoi(argv[2]);
+    double* times = malloc(repeat * sizeof(double));
+
+    void* state = setup(n);
+    run(state, n);
+    for (int i = 0; i < repeat; ++i) {
+        double start = now();
+        run(state, n);
+        times[i] = now() - start;
+    }
+    double time = median(times, repeat);
+
+    if (rank == 0) {
+        printf("mathbench %s n=%d time=%.6f", kernel, n, time);
+        if (flops(n) > 0) printf(" gflops=%.1f", flops(n) / time * 1e-9);
+        printf("\n");
+    }
+#if defined(MATHBENCH_PDSYEVD)
+    Cblacs_gridexit(((struct pdsyevd_state*)state)->context);
+    MPI_Finalize();
+#endif
+    return 0;
+}
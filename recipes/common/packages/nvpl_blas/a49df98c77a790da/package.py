@@ -0,0 +1,21 @@
+# Copyright Spack Project Developers. See COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+
+from spack.package import *
+from spack_repo.builtin.packages.nvpl_blas.package import NvplBlas as BuiltinNvplBlas
+
+
+class NvplBlas(BuiltinNvplBlas):
+    """
+    NVPL BLAS, threaded with OpenMP by default, like the openblas threads=openmp
+    that it replaces in the recipes that select it.
+    """
+
+    variant(
+        "threads",
+        default="openmp",
+        description="Multithreading support",
+        values=("openmp", "none"),
+        multi=False,
+    )
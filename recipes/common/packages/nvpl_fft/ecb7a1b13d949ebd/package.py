@@ -0,0 +1,27 @@
+# Copyright Spack Project Developers. See COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+
+from spack.package import *
+from spack_repo.builtin.packages.nvpl_fft.package import NvplFft as BuiltinNvplFft
+
+
+class NvplFft(BuiltinNvplFft):
+    """
+    NVPL FFT as the fftw-api of a uenv: the FFTW interface, fftw3.h and
+    libnvpl_fftw, which is threaded with OpenMP.
+    """
+
+    @property
+    def headers(self):
+        # fftw3.h is in include/nvpl_compat, and in the deprecated include/nvpl_fftw of older releases
+        for directory in ["nvpl_compat", "nvpl_fftw"]:
+            headers = find_headers("fftw3", join_path(self.spec.prefix.include, directory))
+            if headers:
+                return headers
+        return find_headers("fftw3", self.spec.prefix.include, recursive=True)
+
+    @property
+    def libs(self):
+        # the same library for the fftw-api:openmp query of the packages that use threaded FFTW
+        return find_libraries("libnvpl_fftw", self.spec.prefix.lib, shared=True, recursive=True)
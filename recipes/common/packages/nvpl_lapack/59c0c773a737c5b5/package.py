@@ -0,0 +1,28 @@
+# Copyright Spack Project Developers. See COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+
+from spack.package import *
+from spack_repo.builtin.packages.nvpl_lapack.package import NvplLapack as BuiltinNvplLapack
+
+
+class NvplLapack(BuiltinNvplLapack):
+    """
+    NVPL LAPACK, threaded with OpenMP by default, like the openblas threads=openmp
+    that it replaces in the recipes that select it.
+    """
+
+    threadings = ("openmp", "none")
+    variant(
+        "threads",
+        default="openmp",
+        description="Multithreading support",
+        values=threadings,
+        multi=False,
+    )
+
+    # NVPL LAPACK calls NVPL BLAS, and both have to use the same threading and integers
+    depends_on("nvpl-blas +ilp64", when="+ilp64")
+    depends_on("nvpl-blas ~ilp64", when="~ilp64")
+    for threads in threadings:
+        depends_on(f"nvpl-blas threads={threads}", when=f"threads={threads}")
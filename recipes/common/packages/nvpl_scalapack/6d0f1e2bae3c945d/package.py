@@ -0,0 +1,35 @@
+# Copyright Spack Project Developers. See COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+
+from spack.package import *
+from spack_repo.builtin.packages.nvpl_scalapack.package import (
+    NvplScalapack as BuiltinNvplScalapack,
+)
+
+
+class NvplScalapack(BuiltinNvplScalapack):
+    """
+    NVPL ScaLAPACK, with the BLACS library of the MPI of the uenv: cray-mpich has
+    the ABI of MPICH, and uses the MPICH build of BLACS.
+    """
+
+    @property
+    def scalapack_libs(self):
+        spec = self.spec
+
+        int_type = "ilp64" if spec.satisfies("+ilp64") else "lp64"
+
+        if spec.satisfies("^[virtuals=mpi] openmpi@5:"):
+            mpi_type = "openmpi5"
+        elif spec.satisfies("^[virtuals=mpi] openmpi@4"):
+            mpi_type = "openmpi4"
+        elif spec.satisfies("^[virtuals=mpi] openmpi@3"):
+            mpi_type = "openmpi3"
+        else:
+            # mpich and cray-mpich
+            mpi_type = "mpich"
+
+        name = [f"libnvpl_scalapack_{int_type}", f"libnvpl_blacs_{int_type}_{mpi_type}"]
+
+        return find_libraries(name, spec.prefix.lib, shared=True, recursive=True)
@@ -0,0 +1,54 @@
+# Triton cache manager that reads the kernels compiled when a uenv was built,
+# and writes new kernels to node-local storage.
+#
+# usage, set in the view by environments.yaml:
+#   TRITON_CACHE_MANAGER=uenv_compile_cache:LayeredCacheManager
+#   UENV_TRITON_CACHE_READONLY=/user-environment/compile-cache/triton
+#
+# Kernels are looked up in TRITON_CACHE_DIR first, and then in the read-only
+# cache in the image. New kernels are written to TRITON_CACHE_DIR, which is set
+# by TorchInductor to a directory in its cache, /tmp/torchinductor_<user> by
+# default, and otherwise defaults to /tmp/triton_<user> instead of ~/.triton.
+#
+# This file is installed in the site-packages of the view by
+#   uenv-compile-cache warm
+
+import getpass
+import json
+import os
+import tempfile
+
+from triton.runtime.cache import FileCacheManager
+
+os.environ.setdefault("TRITON_CACHE_DIR", os.path.join(tempfile.gettempdir(), f"triton_{getpass.getuser()}"))
+
+
+class LayeredCacheManager(FileCacheManager):
+    def __init__(self, key, override=False, dump=False):
+        super().__init__(key, override, dump)
+        readonly = os.environ.get("UENV_TRITON_CACHE_READONLY")
+        # the dump and override directories are used for debugging, and are never layered
+        self.readonly_dir = os.path.join(readonly, key) if readonly and not (override or dump) else None
+
+    def _readonly_path(self, filename):
+        if self.readonly_dir is None:
+            return None
+        path = os.path.join(self.readonly_dir, filename)
+        return path if os.path.exists(path) else None
+
+    def get_file(self, filename):
+        return super().get_file(filename) or self._readonly_path(filename)
+
+    def get_group(self, filename):
+        group = super().get_group(filename)
+        if group is not None:
+            return group
+        path = self._readonly_path(f"__grp__{filename}")
+        if path is None:
+            return None
+        with open(path) as f:
+            child_paths = json.load(f).get("child_paths")
+        if child_paths is None:
+            return None
+        # the paths are absolute, and point into the image
+        return {name: p for name, p in child_paths.items() if os.path.exists(p)}
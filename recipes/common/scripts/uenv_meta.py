@@ -0,0 +1,108 @@
+# Read the metadata of a uenv without running Spack: the views in meta/env.json,
+# and the packages in the Spack database of the store, .spack-db/index.json.
+#
+# usage, from a script next to this file in recipe/scripts:
+#   import uenv_meta
+#   uenv_meta.prefix("/user-environment", "cuda")
+#   uenv_meta.view_environment(uenv_meta.load_env("/user-environment")["views"]["default"])
+#
+# and from the command line with uenv-query.
+
+import json
+import os
+
+DATABASE = os.path.join(".spack-db", "index.json")
+
+
+class QueryError(Exception):
+    pass
+
+
+def load_env(store):
+    with open(os.path.join(store, "meta", "env.json")) as f:
+        return json.load(f)
+
+
+def view_environment(view, environment=None):
+    """Return an environment, by default the one of the current process, with a view from env.json loaded."""
+    environment = dict(os.environ if environment is None else environment)
+    for name, value in view["env"]["values"].get("scalar", {}).items():
+        if value is None:
+            environment.pop(name, None)
+        else:
+            environment[name] = value
+    for name, updates in view["env"]["values"]["list"].items():
+        paths = [p for p in environment.get(name, "").split(os.pathsep) if p]
+        for update in updates:
+            if update["op"] == "set":
+                paths = list(update["value"])
+            elif update["op"] == "prepend":
+                paths = list(update["value"]) + paths
+            elif update["op"] == "append":
+                paths += list(update["value"])
+        environment[name] = os.pathsep.join(paths)
+    return environment
+
+
+def packages(store):
+    """Return the packages installed in the store, as dicts with name, version, hash, prefix and explicit."""
+    path = os.path.join(store, DATABASE)
+    if not os.path.exists(path):
+        raise QueryError(f"{store} has no Spack database {DATABASE}")
+    with open(path) as f:
+        installs = json.load(f)["database"]["installs"]
+    result = []
+    for digest, record in installs.items():
+        if not record.get("installed", True) or not record.get("path"):
+            continue
+        spec = record["spec"]
+        result.append(
+            {
+                "name": spec["name"],
+                "version": str(spec.get("version", "")),
+                "hash": digest,
+                "prefix": record["path"],
+                "explicit": record.get("explicit", False),
+            }
+        )
+    return sorted(result, key=lambda p: (p["name"], p["version"], p["hash"]))
+
+
+def version_matches(version, query):
+    """Match versions like Spack: 12 and 12.9 match 12.9.0, but 1.1 does not match 1.14."""
+    return not query or version == query or version.startswith((query + ".", query + "-"))
+
+
+def find(store, query):
+    """Return the package that matches name, name@version or name/hash, where version and hash can be prefixes."""
+    name, _, digest = query.partition("/")
+    name, _, version = name.partition("@")
+    matches = [
+        p
+        for p in packages(store)
+        if p["name"] == name and version_matches(p["version"], version) and p["hash"].startswith(digest)
+    ]
+    if not matches:
+        raise QueryError(f"no package matches {query}")
+    if len(matches) > 1:
+        candidates = ", ".join(f"{p['name']}@{p['version']}/{p['hash'][:7]}" for p in matches)
+        raise QueryError(f"{query} matches several packages, use name@version or name/hash: {candidates}")
+    return matches[0]
+
+
+def prefix(store, query):
+    return find(store, query)["prefix"]
+
+
+def version(store, query):
+    return find(store, query)["version"]
+
+
+def views(store, query):
+    """Return the names of the views that contain a package, from the .spack directory of each view."""
+    name = find(store, query)["name"]
+    return [
+        view
+        for view, config in load_env(store)["views"].items()
+        if os.path.isdir(os.path.join(config["root"], ".spack", name))
+    ]
@@ -1,11 +1,13 @@
 system_specific_scalar_env = [
+    # begin network profile alps-gh200 v2: generated by workflow/util/network-profile.py, do not edit
     "NCCL_NET" => "AWS Libfabric",
     "NCCL_NET_GDR_LEVEL" => "PHB",
-    "NCCL_CROSS_NIC" => "1",
     "NCCL_PROTO" => "^LL128",
     "FI_CXI_DEFAULT_CQ_SIZE" => "131072",
     "FI_CXI_DEFAULT_TX_SIZE" => "16384",
     "FI_CXI_DISABLE_HOST_REGISTER" => "1",
-    "FI_CXI_RX_MATCH_MODE" => "software",
     "FI_MR_CACHE_MONITOR" => "userfaultfd",
+    "NCCL_CROSS_NIC" => "1",
+    "FI_CXI_RX_MATCH_MODE" => "software",
+    # end network profile
 ]
\ No newline at end of file
@@ -0,0 +1 @@
+../../../../common/scripts/uenv_meta.py
\ No newline at end of file
@@ -1,11 +1,21 @@
 # read a yaml file and convert it to a spack package
 # usage: python env-to-package.py <env.yaml> <package-name>
 # example: python env-to-package.py paraview-env.yaml paraview
+#
+# with --build, the package also builds software: the class body in <dir>/build.py
+# (versions, resources, patches, cmake_args, ...) is appended to the generated class,
+# and the other files in <dir>, e.g. patches, are copied next to package.py.
+# example: python scripts/env-to-package.py -f environments.yaml -p paraview-cuda \
+#              --build ../package-template -o repo/packages
+#
+# with --check, nothing is written, and the script exits 1 if the package in
+# the output directory differs from the one that would be generated.
 
 # load a yaml file
 import yaml
 import sys
 import os
+import shutil
 import argparse
 
 # read command line arguments
@@ -20,9 +30,17 @@ parser.add_argument(
     action="store_true",
     help="Add the new package directly to the existing spack installation",
 )
+parser.add_argument(
+    "-b", "--build", help="Directory with the build.py class body and patches of the package"
+)
+parser.add_argument(
+    "-o", "--output", default="./packages", help="Package repository directory to write the package to"
+)
+parser.add_argument(
+    "--check", action="store_true", help="Exit 1 if the package in the output directory is out of date"
+)
 args = parser.parse_args()
 
-os.makedirs("packages", exist_ok=True)
 pkg_class = args.packagename.replace("-", " ").title().replace(" ", "")
 pkg_filename = args.packagename.replace(" ", "").replace("-", "_").lower()
 print(f"Package name: {pkg_class}")
@@ -32,19 +50,20 @@ with open(f"{args.filename}", "r") as stream:
     env = yaml.safe_load(stream)
 
 # change the following generation of the file to a string with the same contents
-output = f"# This file was auto-generated from {args.filename}\n"
+output = f"# This file was auto-generated from {os.path.basename(args.filename)}\n"
 output += "\n"
 output += "import itertools, os, sys\n"
 output += "from spack.package import *\n"
-output += "from spack_repo.builtin.build_systems.cmake import CMakePackage\n"
+output += "from spack_repo.builtin.build_systems.cmake import CMakePackage, generator\n"
 output += "from spack_repo.builtin.build_systems.cuda import CudaPackage\n"
 output += "\n"
 output += f"class {pkg_class}(CMakePackage, CudaPackage):\n"
-output += '    homepage = "https://www.dummy.org/"\n'
-output += '    url      = "https://www.dummy.org/"\n'
-output += '    git      = "https://www.dummy.org/"\n'
-output += "\n"
-output += '    version("1.0")\n'
+if not args.build:
+    output += '    homepage = "https://www.dummy.org/"\n'
+    output += '    url      = "https://www.dummy.org/"\n'
+    output += '    git      = "https://www.dummy.org/"\n'
+    output += "\n"
+    output += '    version("1.0")\n'
 output += '    depends_on("c", type="build")\n'
 output += '    depends_on("cxx", type="build")\n'
 
@@ -58,7 +77,39 @@ except KeyError:
 
 dependencies = []
 for spec in specs:
+    # the environment can contain the package itself, so that it is built with the environment
+    if spec.split()[0] == args.packagename:
+        continue
     output += f'    depends_on("{spec}")\n'
+
+if args.build:
+    with open(os.path.join(args.build, "build.py"), "r") as f:
+        output += "\n" + f.read()
+
+if args.check:
+    tempdir = os.path.join(args.output, pkg_filename)
+    expected = {"package.py": output.encode()}
+    if args.build:
+        for name in sorted(os.listdir(args.build)):
+            if name != "build.py":
+                with open(os.path.join(args.build, name), "rb") as f:
+                    expected[name] = f.read()
+    stale = []
+    for name, contents in expected.items():
+        path = os.path.join(tempdir, name)
+        if not os.path.exists(path):
+            stale.append(path)
+            continue
+        with open(path, "rb") as f:
+            if f.read() != contents:
+                stale.append(path)
+    if stale:
+        print(f"error: {', '.join(stale)} differ from {args.filename}" + (f" and {args.build}" if args.build else ""))
+        print("regenerate them without --check")
+        sys.exit(1)
+    print(f"{tempdir} is up to date")
+    sys.exit(0)
+
 print(output)
 
 if args.add:
@@ -66,7 +117,7 @@ if args.add:
     tempdir = os.path.join(spack_package_root, pkg_filename)
 else:
     # create a subdir named after the package if the subdir doesn't already exist
-    tempdir = os.path.join("./packages", pkg_filename)
+    tempdir = os.path.join(args.output, pkg_filename)
 
 os.makedirs(tempdir, exist_ok=True)
 print("Writing temp package to " + os.path.join(tempdir, "package.py"))
@@ -77,3 +128,8 @@ with open(tempfile, "w") as f:
     f.write(output)
     f.close()
     print(f"Temporary file {tempfile} has been created")
+
+if args.build:
+    for name in sorted(os.listdir(args.build)):
+        if name != "build.py":
+            shutil.copy(os.path.join(args.build, name), tempdir)
@@ -0,0 +1,90 @@
+    # ParaView is built by Spack, so that it is hashed and pushed to the build cache
+    # like every other package, instead of being rebuilt by post-install on every build.
+    homepage = "https://www.paraview.org"
+    git = "https://gitlab.kitware.com/paraview/paraview.git"
+
+    # the git tag has the same contents as the ParaView-v6.0.1.tar.xz release tarball
+    version("6.0.1", tag="v6.0.1", submodules=True)
+
+    generator("ninja")
+
+    # the mpi of the environment is set by network: in environments.yaml, not in specs
+    depends_on("mpi")
+
+    # enable lazy loading of grids in the CDIReader
+    patch("cdi-reader-lazy-grid-load.patch")
+
+    resource(
+        name="paraview-gadget-plugin",
+        git="https://github.com/jfavre/ParaViewGadgetPlugin",
+        commit="d9d12bde19454199b733b4e1285be3dcd1ac5595",
+        destination="uenv-plugins",
+        placement="ParaViewGadgetPlugin",
+    )
+
+    def patch(self):
+        # https://gitlab.kitware.com/vtk/vtk/-/merge_requests/12857
+        # the sources of a mirror or a source cache have no .git, so they are searched with os.walk
+        for directory, subdirectories, files in os.walk(os.getcwd()):
+            for i in files:
+                file_path = os.path.join(directory, i)
+                if os.path.islink(file_path):
+                    continue
+                with open(file_path, "rb") as f:
+                    if b"VTK::hdf5" not in f.read():
+                        continue
+                filter_file("VTK::hdf5", "VTK::vtkhdf5", file_path, string=True)
+
+    def cmake_args(self):
+        cuda = self.spec.satisfies("+cuda")
+        args = [
+            self.define("PARAVIEW_BUILD_EDITION", "CANONICAL"),
+            self.define("PARAVIEW_BUILD_TESTING", False),
+            self.define("PARAVIEW_BUILD_WITH_EXTERNAL", True),
+            self.define("PARAVIEW_INSTALL_DEVELOPMENT_FILES", True),
+            self.define("PARAVIEW_USE_CUDA", cuda),
+            self.define("PARAVIEW_USE_MPI", True),
+            self.define("PARAVIEW_USE_PYTHON", True),
+            self.define("PARAVIEW_USE_QT", False),
+            self.define("PARAVIEW_USE_VISKORES", True),
+            self.define("PARAVIEW_ENABLE_RAYTRACING", True),
+            self.define("PARAVIEW_ENABLE_CATALYST", True),
+            self.define("PARAVIEW_ENABLE_WEB", False),
+            self.define("PARAVIEW_ENABLE_ADIOS2", True),
+            self.define("PARAVIEW_ENABLE_FIDES", True),
+            self.define("PARAVIEW_ENABLE_VISITBRIDGE", True),
+            self.define("PARAVIEW_PLUGIN_ENABLE_CDIReader", True),
+            self.define("PARAVIEW_PLUGIN_ENABLE_NetCDFTimeAnnotationPlugin", True),
+            self.define("PARAVIEW_PLUGIN_ENABLE_pvNVIDIAIndeX", cuda),
+            self.define("PARAVIEW_PLUGIN_AUTOLOAD_pvNVIDIAIndeX", False),
+            self.define("VTK_USE_X", False),
+            # EGL on the GPU nodes, software rendering with OSMesa on the CPU nodes
+            self.define("VTK_OPENGL_HAS_EGL", cuda),
+            self.define("VTK_OPENGL_HAS_OSMESA", not cuda),
+            self.define("VTK_SMP_IMPLEMENTATION_TYPE", "TBB"),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_token", False),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_exprtk", False),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_vtkviskores", False),
+            self.define("VTKOSPRAY_ENABLE_DENOISER", True),
+        ]
+        if cuda:
+            args.append(self.define_from_variant("CMAKE_CUDA_ARCHITECTURES", "cuda_arch"))
+        return args
+
+    @run_after("install")
+    def install_gadget_plugin(self):
+        # plugins are installed in paraview-plugins, which post-install links into the uenv
+        cmake = self.spec["cmake"].command
+        build_dir = join_path(self.stage.path, "ParaViewGadgetPlugin-build")
+        cmake(
+            "-G",
+            "Ninja",
+            "-S",
+            join_path(self.stage.source_path, "uenv-plugins", "ParaViewGadgetPlugin"),
+            "-B",
+            build_dir,
+            self.define("CMAKE_PREFIX_PATH", self.prefix),
+            f"--install-prefix={join_path(self.prefix, 'paraview-plugins')}",
+        )
+        cmake("--build", build_dir, f"-j{make_jobs}")
+        cmake("--install", build_dir)
@@ -0,0 +1,166 @@
+# This file was auto-generated from environments.yaml
+
+import itertools, os, sys
+from spack.package import *
+from spack_repo.builtin.build_systems.cmake import CMakePackage, generator
+from spack_repo.builtin.build_systems.cuda import CudaPackage
+
+class ParaviewOsmesa(CMakePackage, CudaPackage):
+    depends_on("c", type="build")
+    depends_on("cxx", type="build")
+    depends_on("cmake")
+    depends_on("ninja")
+    depends_on("fmt@11")
+    depends_on("boost +atomic +chrono +container +context +date_time +filesystem +graph +json +mpi +multithreaded +program_options +regex +serialization +shared +system +thread ~test")
+    depends_on("hdf5 +mpi +cxx +hl +threadsafe +shared ~java")
+    depends_on("netcdf-c +mpi")
+    depends_on("lz4")
+    depends_on("adios2 +python +hdf5 +libcatalyst")
+    depends_on("adios-catalyst")
+    depends_on("tbb")
+    depends_on("libcatalyst +mpi +python")
+    depends_on("fides")
+    depends_on("abseil-cpp")
+    depends_on("cgns")
+    depends_on("cli11")
+    depends_on("double-conversion")
+    depends_on("eigen")
+    depends_on("expat")
+    depends_on("fast-float@7")
+    depends_on("fmt@11")
+    depends_on("freetype")
+    depends_on("git")
+    depends_on("gl2ps")
+    depends_on("glew")
+    depends_on("jpeg")
+    depends_on("jsoncpp")
+    depends_on("libharu")
+    depends_on("libogg")
+    depends_on("libpng")
+    depends_on("libtheora")
+    depends_on("libtiff")
+    depends_on("libxml2")
+    depends_on("nlohmann-json")
+    depends_on("parallel-netcdf")
+    depends_on("pegtl@2")
+    depends_on("proj")
+    depends_on("protobuf")
+    depends_on("pugixml")
+    depends_on("seacas@2025-02-27 ~legacy")
+    depends_on("sqlite")
+    depends_on("utf8cpp")
+    depends_on("verdict +shared")
+    depends_on("xz")
+    depends_on("zlib-ng")
+    depends_on("viskores@1.1 +64bitids +tbb +vtktypes")
+    depends_on("cdi")
+    depends_on("python")
+    depends_on("py-numpy")
+    depends_on("py-pandas")
+    depends_on("py-matplotlib")
+    depends_on("py-mpi4py")
+    depends_on("py-cftime")
+    depends_on("py-h5py")
+    depends_on("ospray ~mpi +denoiser +volumes ~apps ~glm")
+    depends_on("ispc")
+    depends_on("openvkl")
+    depends_on("embree")
+    depends_on("rkcommon")
+    depends_on("openimagedenoise")
+    depends_on("mesa +osmesa ~glx +llvm %libllvm=llvm ~clang~flang")
+    depends_on("osmesa")
+
+    # ParaView is built by Spack, so that it is hashed and pushed to the build cache
+    # like every other package, instead of being rebuilt by post-install on every build.
+    homepage = "https://www.paraview.org"
+    git = "https://gitlab.kitware.com/paraview/paraview.git"
+
+    version("6.1.1", tag="v6.1.1", submodules=True)
+
+    generator("ninja")
+
+    # the mpi of the environment is set by network: in environments.yaml, not in specs
+    depends_on("mpi")
+
+    # NOTE: https://gitlab.kitware.com/vtk/vtk/-/work_items/19940
+    patch("vtk-viskores-imported-targets.patch", working_dir="VTK")
+
+    resource(
+        name="paraview-gadget-plugin",
+        git="https://github.com/jfavre/ParaViewGadgetPlugin",
+        commit="d9d12bde19454199b733b4e1285be3dcd1ac5595",
+        destination="uenv-plugins",
+        placement="ParaViewGadgetPlugin",
+    )
+
+    def patch(self):
+        # NOTE: a proper fix has been merged in master but it is not part of v6.1.0
+        # the sources of a mirror or a source cache have no .git, so they are searched with os.walk
+        for directory, subdirectories, files in os.walk(os.getcwd()):
+            for i in files:
+                file_path = os.path.join(directory, i)
+                if os.path.islink(file_path):
+                    continue
+                with open(file_path, "rb") as f:
+                    if b"VTK::hdf5" not in f.read():
+                        continue
+                filter_file("VTK::hdf5", "VTK::hdf5vtk", file_path, string=True)
+
+    def cmake_args(self):
+        cuda = self.spec.satisfies("+cuda")
+        args = [
+            self.define("PARAVIEW_BUILD_EDITION", "CANONICAL"),
+            self.define("PARAVIEW_BUILD_TESTING", False),
+            self.define("PARAVIEW_BUILD_WITH_EXTERNAL", True),
+            self.define("PARAVIEW_INSTALL_DEVELOPMENT_FILES", True),
+            self.define("PARAVIEW_RELOCATABLE_INSTALL", False),
+            self.define("PARAVIEW_VERSIONED_INSTALL", False),
+            self.define("PARAVIEW_USE_CUDA", cuda),
+            self.define("PARAVIEW_USE_MPI", True),
+            self.define("PARAVIEW_USE_PYTHON", True),
+            self.define("PARAVIEW_USE_QT", False),
+            self.define("PARAVIEW_USE_VISKORES", True),
+            self.define("PARAVIEW_ENABLE_RAYTRACING", True),
+            self.define("PARAVIEW_ENABLE_CATALYST", True),
+            self.define("PARAVIEW_ENABLE_WEB", False),
+            self.define("PARAVIEW_ENABLE_ADIOS2", True),
+            self.define("PARAVIEW_ENABLE_FIDES", True),
+            self.define("PARAVIEW_ENABLE_VISITBRIDGE", True),
+            self.define("PARAVIEW_PLUGIN_ENABLE_CDIReader", True),
+            self.define("PARAVIEW_PLUGIN_ENABLE_NetCDFTimeAnnotationPlugin", True),
+            self.define("PARAVIEW_PLUGIN_ENABLE_pvNVIDIAIndeX", cuda),
+            self.define("PARAVIEW_PLUGIN_AUTOLOAD_pvNVIDIAIndeX", False),
+            self.define("VTK_USE_X", False),
+            self.define("VTK_USE_Wayland", False),
+            # EGL on the GPU nodes, software rendering with OSMesa on the CPU nodes
+            self.define("VTK_OPENGL_HAS_EGL", cuda),
+            self.define("VTK_OPENGL_HAS_OSMESA", not cuda),
+            self.define("VTK_SMP_IMPLEMENTATION_TYPE", "TBB"),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_scn", False),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_fast_float", False),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_token", False),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_exprtk", False),
+            self.define("VTK_MODULE_USE_EXTERNAL_VTK_vtkviskores", True),
+            self.define("VTKOSPRAY_ENABLE_DENOISER", True),
+        ]
+        if cuda:
+            args.append(self.define_from_variant("CMAKE_CUDA_ARCHITECTURES", "cuda_arch"))
+        return args
+
+    @run_after("install")
+    def install_gadget_plugin(self):
+        # plugins are installed in paraview-plugins, which post-install links into the uenv
+        cmake = self.spec["cmake"].command
+        build_dir = join_path(self.stage.path, "ParaViewGadgetPlugin-build")
+        cmake(
+            "-G",
+            "Ninja",
+            "-S",
+            join_path(self.stage.source_path, "uenv-plugins", "ParaViewGadgetPlugin"),
+            "-B",
+            build_dir,
+            self.define("CMAKE_PREFIX_PATH", self.prefix),
+            f"--install-prefix={join_path(self.prefix, 'paraview-plugins')}",
+        )
+        cmake("--build", build_dir, f"-j{make_jobs}")
+        cmake("--install", build_dir)
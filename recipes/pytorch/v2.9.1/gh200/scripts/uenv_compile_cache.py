@@ -0,0 +1 @@
+../../../../common/scripts/uenv_compile_cache.py
\ No newline at end of file
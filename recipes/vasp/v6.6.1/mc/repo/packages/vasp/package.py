@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: (Apache-2.0 OR MIT)
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import spack.util.environment
@@ -43,6 +44,26 @@ class Vasp(MakefilePackage, CudaPackage):
     variant("libxc", default=False, description="Enabled LibXC support")
     variant("dftd4", default=False, description="Enabled DFTD4 support")
     variant("simple_dftd3", default=False, description="Enabled simple dtd3 support")
+    variant(
+        "executables",
+        default="std,gam,ncl",
+        values=("std", "gam", "ncl"),
+        multi=True,
+        description="VASP executables to build",
+    )
+    variant("shmem", default=False, description="Share the large work arrays between the ranks of a node (-Duse_shmem)")
+    variant(
+        "fock_dblbuf",
+        default=True,
+        description="Double buffering in the Fock exchange of hybrid functionals (-Dfock_dblbuf)",
+    )
+    variant("bse_te", default=True, description="Time evolution algorithm of BSE calculations (-Duse_bse_te)")
+    variant(
+        "cache_size",
+        default="4000",
+        values=lambda x: x.isdigit(),
+        description="Cache blocking size of the FFTs, in complex numbers (-DCACHE_SIZE)",
+    )
 
     # Language dependencies (required in Spack v1.0+)
     depends_on("c", type="build")
@@ -194,6 +215,17 @@ class Vasp(MakefilePackage, CudaPackage):
                 module_path = os.path.dirname(module_dir[0])
                 incs.append(f"-I{module_path}")
 
+        # the performance options of the template are replaced by the ones of the variants
+        for option in [r"-Duse_shmem\b", r"-Dfock_dblbuf\b", r"-Duse_bse_te\b", r"-DCACHE_SIZE=[0-9]+"]:
+            filter_file(option, "", make_include)
+        cpp_options.append(f"-DCACHE_SIZE={spec.variants['cache_size'].value}")
+        if spec.satisfies("+shmem"):
+            cpp_options.append("-Duse_shmem")
+        if spec.satisfies("+fock_dblbuf"):
+            cpp_options.append("-Dfock_dblbuf")
+        if spec.satisfies("+bse_te"):
+            cpp_options.append("-Duse_bse_te")
+
         filter_file(r"^VASP_TARGET_CPU[ ]{0,}\?=.*", "", make_include)
 
         # prepend CPP options
@@ -214,7 +246,15 @@ class Vasp(MakefilePackage, CudaPackage):
             spack_env.set("NVHPC_CUDA_HOME", self.spec["cuda"].prefix)
 
     def build(self, spec, prefix):
-        make("DEPS=1, all, -j1")
+        # every executable is built in its own tree, build/<executable>, so the builds run
+        # concurrently and share the jobs of the package between them
+        executables = spec.variants["executables"].value
+        jobs = max(1, make_jobs // len(executables))
+        make_executable = MakeExecutable(make.path, jobs=jobs)
+        with ThreadPoolExecutor(max_workers=len(executables)) as pool:
+            builds = [pool.submit(make_executable, "DEPS=1", executable) for executable in executables]
+            for build in builds:
+                build.result()
 
     def install(self, spec, prefix):
         install_tree("bin/", prefix.bin)
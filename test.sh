@@ -6,6 +6,12 @@ system=eiger
 uenv=prgenv-gnu:24.7
 uarch=zen2
 
+# ./test.sh --since <commit> lists the build jobs affected by the changes since <commit>
+if [ "$1" == "--since" ]; then
+    python3 ./workflow/util/impacted-uenvs.py --since "$2"
+    exit
+fi
+
 echo "==== CLONING THE PIPELINE ===="
 if [ -d ./uenv-pipeline ]; then
     echo "== cleaning up old copy"
@@ -27,4 +33,7 @@ cat tmp.sh
 
 echo ""
 echo "==== RUNNING THE BUILD COMMAND ===="
-./tmp.sh
+# sample the memory and parallelism of each package, see docs/pkg-workflow-tools.md
+build_dir=./build
+mkdir -p $build_dir
+python3 ./workflow/util/build-stats.py monitor --log $build_dir/build-monitor.jsonl -- ./tmp.sh
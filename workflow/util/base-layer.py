@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+# Pin the packages of an application recipe to the specs of a base uenv, so that
+# the packages they share concretize to the same hashes and are installed from the
+# build cache instead of being rebuilt.
+#
+# The base layer is declared in base.yaml, next to the recipe's config.yaml:
+#
+#   uenv: prgenv-gnu:26.3        # the base uenv in config.yaml
+#   uarch: gh200                 # the uarch of the base recipe to use
+#   environments: [gcc-env]      # optional, the environments of the base to pin to (default: all)
+#   exclude: [hdf5]              # optional, packages that the application configures differently
+#
+# usage:
+#   python3 base-layer.py recipes/gromacs/2025/gh200                 # write the pins into packages.yaml
+#   python3 base-layer.py recipes/gromacs/2025/gh200 --check         # exit 1 if the pins are out of date
+#   python3 base-layer.py recipes/gromacs/2025/gh200 --report        # packages shared with the base
+#
+# The base recipe must have been concretized with concretize-recipe.py, using
+# the same --repo arguments, and --report requires the application recipe to
+# have been concretized after the pins were written.
+#
+# The pins are written between two marker comments at the end of packages.yaml,
+# which are replaced on every run, so hand-written entries and comments are kept.
+# Packages that are configured in the hand-written part of packages.yaml are not
+# pinned.
+
+import argparse
+import json
+import os
+import sys
+
+import yaml
+
+import uenv_recipes
+
+BEGIN = "  # begin base layer {uenv}: generated by workflow/util/base-layer.py, do not edit\n"
+END = "  # end base layer\n"
+
+# parameters of a concrete spec that are not variants
+NOT_VARIANTS = {"cflags", "cxxflags", "fflags", "cppflags", "ldflags", "ldlibs", "patches", "dev_path"}
+
+# packages that are provided by the compilers.yaml of each recipe
+COMPILER_PACKAGES = {"gcc", "gcc-runtime", "llvm", "nvhpc", "compiler-wrapper", "glibc"}
+
+
+def read_yaml(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r") as stream:
+        return yaml.safe_load(stream)
+
+
+def split_packages_yaml(path, uenv):
+    """Return the hand-written text of packages.yaml and the generated pins, without the markers."""
+    if not os.path.exists(path):
+        return "packages:\n", ""
+    with open(path) as f:
+        text = f.read()
+    begin = text.find(BEGIN.split("{uenv}")[0])
+    if begin < 0:
+        return text, ""
+    end = text.index(END, begin)
+    start = text.index("\n", begin) + 1
+    return text[:begin] + text[end + len(END) :], text[start:end]
+
+
+def spec_string(spec):
+    """Return the version and variants of a concrete spec in a spack.lock, as a spec string."""
+    parts = [f"@={spec['version']}"]
+    for name, value in sorted(spec.get("parameters", {}).items()):
+        if name in NOT_VARIANTS:
+            continue
+        if value is True:
+            parts.append(f"+{name}")
+        elif value is False:
+            parts.append(f"~{name}")
+        elif isinstance(value, list):
+            if value:
+                parts.append(f"{name}={','.join(str(v) for v in value)}")
+        else:
+            parts.append(f"{name}={value}")
+    return " ".join(parts)
+
+
+def lock_files(entry, environments, label):
+    with open(os.path.join(entry, "result.json")) as f:
+        result = json.load(f)
+    names = environments or list(result["environments"])
+    for name in names:
+        if name not in result["environments"]:
+            print(f"error: {label} has no environment {name}")
+            sys.exit(1)
+        if not result["environments"][name]["success"]:
+            print(f"error: environment {name} of {label} failed to concretize")
+            sys.exit(1)
+        yield os.path.join(entry, name, "spack.lock")
+
+
+def base_specs(paths):
+    """Return {name: spec string} for the packages built in a set of spack.lock files.
+
+    Packages that appear with several different specs are left out, because
+    the application can only be pinned to one of them.
+    """
+    specs = {}
+    for path in paths:
+        with open(path) as f:
+            for spec in json.load(f)["concrete_specs"].values():
+                if spec.get("external") or spec["name"] in COMPILER_PACKAGES:
+                    continue
+                specs.setdefault(spec["name"], set()).add(spec_string(spec))
+    return {name: strings.pop() for name, strings in specs.items() if len(strings) == 1}
+
+
+def lock_hashes(paths):
+    hashes = {}
+    for path in paths:
+        with open(path) as f:
+            for digest, spec in json.load(f)["concrete_specs"].items():
+                if not spec.get("external"):
+                    hashes[digest] = spec["name"]
+    return hashes
+
+
+def check_compatible(recipe, base):
+    """Warn about differences between the recipes that prevent the hashes from matching."""
+    config = read_yaml(os.path.join(recipe, "config.yaml"))["spack"]
+    base_config = read_yaml(os.path.join(base, "config.yaml"))["spack"]
+    if config["commit"] != base_config["commit"]:
+        print(f"warning: Spack {config['commit']} differs from Spack {base_config['commit']} of the base")
+    if config.get("packages", {}).get("commit") != base_config.get("packages", {}).get("commit"):
+        print("warning: the spack-packages commit differs from the base")
+    if read_yaml(os.path.join(recipe, "compilers.yaml")) != read_yaml(os.path.join(base, "compilers.yaml")):
+        print("warning: compilers.yaml differs from the base")
+
+
+def cache_entry(recipe, uarch, repos, cache):
+    try:
+        key = uenv_recipes.recipe_hash(recipe, uenv_recipes.UARCH_TARGETS.get(uarch), repos)
+    except RuntimeError as e:
+        print(f"error: {e}")
+        sys.exit(1)
+    entry = uenv_recipes.concretization_entry(cache, key)
+    if not os.path.exists(os.path.join(entry, "result.json")):
+        print(f"error: {os.path.relpath(recipe)} has not been concretized for {uarch}, run concretize-recipe.py first")
+        sys.exit(1)
+    return entry
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("recipe", help="Path of the application recipe, which contains base.yaml")
+parser.add_argument("--repo", action="append", default=[], help="Additional Spack package repository, as given to concretize-recipe.py")
+parser.add_argument("--cache", default=uenv_recipes.CONCRETIZE_CACHE, help="Path of the concretization cache")
+parser.add_argument("--check", action="store_true", help="Do not write packages.yaml, exit 1 if the pins are out of date")
+parser.add_argument("--report", action="store_true", help="Print the packages of the application that are shared with the base")
+args = parser.parse_args()
+
+recipe = os.path.abspath(args.recipe)
+base_yaml = read_yaml(os.path.join(recipe, "base.yaml"))
+if not base_yaml:
+    print(f"error: {os.path.join(args.recipe, 'base.yaml')} does not exist")
+    sys.exit(1)
+uenv, uarch = base_yaml["uenv"], base_yaml["uarch"]
+base = uenv_recipes.uenv_recipe_path(uenv, uarch)
+repos = [os.path.abspath(path) for path in args.repo]
+check_compatible(recipe, base)
+base_locks = list(lock_files(cache_entry(base, uarch, repos, args.cache), base_yaml.get("environments"), uenv))
+
+if args.report:
+    base_hashes = lock_hashes(base_locks)
+    entry = cache_entry(recipe, uarch, repos, args.cache)
+    hashes = lock_hashes(lock_files(entry, None, args.recipe))
+    shared = sorted(name for digest, name in hashes.items() if digest in base_hashes)
+    built = sorted(name for digest, name in hashes.items() if digest not in base_hashes)
+    print(f"{len(shared)} of {len(hashes)} packages are shared with {uenv}, {len(built)} are built by the recipe:")
+    print("\n".join(f"    {name}" for name in built))
+    sys.exit(0)
+
+path = os.path.join(recipe, "packages.yaml")
+text, old_pins = split_packages_yaml(path, uenv)
+configured = (yaml.safe_load(text) or {}).get("packages") or {}
+excluded = set(base_yaml.get("exclude", [])) | set(configured)
+specs = {name: spec for name, spec in sorted(base_specs(base_locks).items()) if name not in excluded}
+pins = "".join(f"  {name}:\n    require: \"{spec}\"\n" for name, spec in specs.items())
+
+if args.check:
+    if pins != old_pins:
+        print(f"{args.recipe}: the packages pinned to {uenv} are out of date, run base-layer.py {args.recipe}")
+        sys.exit(1)
+    print(f"{args.recipe}: {len(specs)} packages pinned to {uenv}")
+    sys.exit(0)
+
+if not text.endswith("\n"):
+    text += "\n"
+with open(path, "w") as f:
+    f.write(text + BEGIN.format(uenv=uenv) + pins + END)
+print(f"{os.path.relpath(path)}: pinned {len(specs)} packages to {uenv}")
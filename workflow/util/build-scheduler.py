@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+# Install the packages of a concretized Spack environment, building independent
+# packages at the same time, with the number of build jobs of each package
+# chosen so that the build node does not run out of memory.
+#
+# usage:
+#   python3 build-scheduler.py --db build-stats.sqlite --spack "spack -C $BUILD/config" \
+#       -e $BUILD/environments/<env> [--cpus 128] [--memory-gb 400]
+#
+# The memory used by one build job of a package is the largest process recorded
+# for it in the build-stats.py database, e.g. one instance of the C++ compiler
+# when building py-torch. Packages that have never been recorded are assumed to
+# use --default-job-memory-gb per job.
+#
+# Each package is installed by a separate `spack install --only package -f`
+# outside the environment, from a spec file written from the spack.lock of the
+# environment, so that the concurrent installs do not write the environment or
+# its views: they only share the store, whose database Spack locks. The
+# environment is installed afterwards with `spack -e <env> install`, which finds
+# every package installed and writes the views once.
+#
+# The build time of each package and the peak memory use of its largest process
+# are added to the database. The peak is the ru_maxrss of the spack install
+# process, which includes the Python process of Spack itself: a peak that is not
+# larger than that of a Spack process that installs nothing, measured before the
+# build, is not recorded, so that it is not taken for the memory of a build job.
+#
+# The scheduler is experimental: the pipeline builds with stackinator, which
+# installs the environments itself, and does not use it. It is run by hand in a
+# stackinator build directory, before make store.squashfs.
+
+import argparse
+import collections
+import json
+import os
+import resource
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import buildstats
+
+
+def mem_available_kb():
+    with open("/proc/meminfo") as f:
+        for line in f:
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1])
+    raise RuntimeError("MemAvailable not found in /proc/meminfo")
+
+
+def installed_hashes(spack):
+    """Return the hashes installed in the store, and the peak memory use of the Spack process, in kB."""
+    output = subprocess.run(spack + ["find", "--format", "{hash}"], check=True, capture_output=True, text=True).stdout
+    return set(output.split()), resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+
+def write_spec_files(lock_path, hashes, directory):
+    """Write a spec file of every package from a spack.lock, with the package and its dependencies."""
+    with open(lock_path) as f:
+        lock = json.load(f)
+    version = lock["_meta"].get("specfile-version")
+    if version is None:
+        raise RuntimeError(f"{lock_path} is an old spack.lock without specfile-version, concretize it again")
+    specs = lock["concrete_specs"]
+    for digest in hashes:
+        closure = [digest]
+        for node in closure:
+            closure += [dep["hash"] for dep in specs[node].get("dependencies", []) if dep["hash"] not in closure]
+        nodes = [dict(specs[node], hash=node) for node in closure]
+        with open(os.path.join(directory, f"{digest}.json"), "w") as f:
+            json.dump({"spec": {"_meta": {"version": version}, "nodes": nodes}}, f)
+
+
+def bottom_levels(dag, durations):
+    """Return the length of the longest path from each node to the end of the build, used as its priority."""
+    dependents = collections.defaultdict(list)
+    for digest, (_, _, deps) in dag.items():
+        for dep in deps:
+            dependents[dep].append(digest)
+    levels = {}
+
+    def level(digest):
+        if digest not in levels:
+            levels[digest] = durations[digest] + max((level(d) for d in dependents[digest]), default=0)
+        return levels[digest]
+
+    sys.setrecursionlimit(max(1000, 4 * len(dag)))
+    for digest in dag:
+        level(digest)
+    return levels
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-e", "--env", required=True, help="Path of the concretized Spack environment")
+parser.add_argument("--spack", default="spack", help="Spack command, e.g. 'spack -C $BUILD/config'")
+parser.add_argument("--db", required=True, help="Path of the build-stats.py database")
+parser.add_argument("--uenv", help="name:version of the uenv, for the records in the database")
+parser.add_argument("--uarch", help="uarch of the build, for the records in the database")
+parser.add_argument("--run", default=os.environ.get("CI_PIPELINE_ID", time.strftime("%Y%m%d-%H%M%S")))
+parser.add_argument("--cpus", type=int, default=os.environ.get("SLURM_CPUS_PER_TASK", os.cpu_count()))
+parser.add_argument("--memory-gb", type=float, help="Memory available for building (default: 90%% of MemAvailable)")
+parser.add_argument("--default-job-memory-gb", type=float, default=2.0, help="Memory per job of unrecorded packages")
+parser.add_argument("--dry-run", action="store_true", help="Print the job count of each package and exit")
+args = parser.parse_args()
+
+spack = shlex.split(args.spack)
+db = buildstats.open_db(args.db)
+lock_path = os.path.join(args.env, "spack.lock")
+if not os.path.exists(lock_path):
+    print(f"error: {args.env} has no spack.lock, concretize the environment first")
+    sys.exit(1)
+dag = buildstats.load_dag([lock_path])
+installed, spack_rss = installed_hashes(spack)
+dag = {d: (n, v, [x for x in deps if x not in installed]) for d, (n, v, deps) in dag.items() if d not in installed}
+
+memory = int(args.memory_gb * 1024 * 1024) if args.memory_gb else int(0.9 * mem_available_kb())
+durations = {}
+job_memory = {}
+wanted_jobs = {}
+for digest, (name, version, _) in dag.items():
+    durations[digest] = buildstats.estimate(db, name, version, args.uarch)[0]
+    job_memory[digest] = buildstats.process_memory(db, name) or int(args.default_job_memory_gb * 1024 * 1024)
+    wanted_jobs[digest] = max(1, min(args.cpus, memory // job_memory[digest]))
+priority = bottom_levels(dag, durations)
+
+print(f"==> {len(dag)} packages to install with {args.cpus} cpus and {memory / 1024**2:.0f} GB of memory")
+if args.dry_run:
+    for digest in sorted(dag, key=lambda d: -priority[d]):
+        name, version, _ = dag[digest]
+        print(f"    -j{wanted_jobs[digest]:<4} {job_memory[digest] / 1024**2:5.1f} GB/job  {name}@{version} /{digest[:7]}")
+    sys.exit(0)
+
+spec_dir = tempfile.mkdtemp(prefix="build-scheduler-")
+try:
+    write_spec_files(lock_path, dag, spec_dir)
+
+    remaining = {digest: set(deps) for digest, (_, _, deps) in dag.items()}
+    dependents = collections.defaultdict(list)
+    for digest, (_, _, deps) in dag.items():
+        for dep in deps:
+            dependents[dep].append(digest)
+    ready = [digest for digest, deps in remaining.items() if not deps]
+    running = {}  # pid -> (digest, jobs, start)
+    free_cpus = args.cpus
+    free_memory = memory
+    failed = []
+
+    while ready or running:
+        # start the most critical packages first, and each with as many jobs as memory allows
+        ready.sort(key=lambda d: -priority[d])
+        for digest in list(ready):
+            jobs = min(wanted_jobs[digest], free_cpus, free_memory // job_memory[digest])
+            if not running:
+                jobs = max(jobs, 1)
+            # do not start a large build with a fraction of its jobs unless nothing else is running
+            elif jobs < 1 or jobs < wanted_jobs[digest] // 4:
+                continue
+            name, version, _ = dag[digest]
+            spec_file = os.path.join(spec_dir, f"{digest}.json")
+            command = spack + ["install", "--only", "package", f"-j{jobs}", "-f", spec_file]
+            print(f"==> starting {name}@{version} /{digest[:7]} with -j{jobs}", flush=True)
+            process = subprocess.Popen(command)
+            running[process.pid] = (digest, jobs, time.time())
+            ready.remove(digest)
+            free_cpus -= jobs
+            free_memory -= jobs * job_memory[digest]
+
+        pid, status, usage = os.wait4(-1, 0)
+        if pid not in running:
+            continue
+        digest, jobs, start = running.pop(pid)
+        free_cpus += jobs
+        free_memory += jobs * job_memory[digest]
+        name, version, _ = dag[digest]
+        seconds = time.time() - start
+
+        if os.waitstatus_to_exitcode(status) != 0:
+            print(f"==> error: {name}@{version} /{digest[:7]} failed")
+            failed.append(name)
+            continue
+
+        # ru_maxrss is the largest resident set of the process or any of its descendants, in kB,
+        # which is Spack itself if no build process is larger
+        peak = usage.ru_maxrss if usage.ru_maxrss > spack_rss else None
+        largest = f"{peak / 1024**2:.1f} GB" if peak else "not larger than Spack"
+        print(f"==> installed {name}@{version} in {seconds / 60:.1f} min, largest process {largest}")
+        buildstats.insert(
+            db,
+            run=args.run,
+            uenv=args.uenv,
+            uarch=args.uarch,
+            name=name,
+            version=version,
+            hash=digest,
+            seconds=seconds,
+            peak_process_rss_kb=peak,
+            jobs=jobs,
+        )
+        db.commit()
+        for dependent in dependents[digest]:
+            remaining[dependent].discard(digest)
+            if not remaining[dependent]:
+                ready.append(dependent)
+except RuntimeError as e:
+    print(f"error: {e}")
+    sys.exit(1)
+finally:
+    shutil.rmtree(spec_dir)
+
+if failed:
+    print(f"==> error: {len(failed)} packages failed to build: {' '.join(failed)}")
+    sys.exit(1)
+print(f"==> all packages installed, install the environment with: spack -e {args.env} install")
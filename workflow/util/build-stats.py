@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+
+# Record how long each package takes to build, and use the records to find the
+# critical path of a uenv build and to predict how long it will take.
+#
+# usage:
+#   # run a build, sampling the memory and parallelism of every package being built
+#   python3 build-stats.py monitor --log monitor.jsonl -- ./build-command
+#
+#   # add the packages installed in a uenv store, or in the squashfs image of one, to the database
+#   python3 build-stats.py record --db build-stats.sqlite --store $BUILD/store \
+#       --uenv cp2k:2025.1 --uarch gh200 --monitor-log monitor.jsonl
+#   python3 build-stats.py record --db build-stats.sqlite --image store.squashfs --uenv cp2k:2025.1 --uarch gh200
+#
+#   # critical path and predicted build time, using the spack.lock files cached by concretize-recipe.py
+#   python3 build-stats.py critical-path --db build-stats.sqlite --uenv cp2k:2025.1 --uarch gh200
+#
+# monitor attributes processes to the package they build using their working
+# directory, which is inside the package's Spack stage while it is built. record
+# reads the packages from the Spack database of the store, .spack-db/index.json,
+# and their build times from install_times.json in the prefix of each.
+
+import argparse
+import collections
+import glob
+import json
+import math
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import buildstats
+import uenv_recipes
+
+sys.path.insert(0, os.path.join(uenv_recipes.RECIPES_ROOT, "common", "scripts"))
+import uenv_meta  # noqa: E402
+
+# spack-stage-<name>-<version>-<hash>
+STAGE_REGEX = re.compile(r"spack-stage-(.+)-([a-z0-9]{32})(?:/|$)")
+
+def read_proc(pid):
+    """Return (cwd, rss_kb, running) for a process, or None if it can not be read."""
+    try:
+        cwd = os.readlink(f"/proc/{pid}/cwd")
+        with open(f"/proc/{pid}/status") as f:
+            status = f.read()
+    except OSError:
+        return None
+    rss = re.search(r"^VmRSS:\s+(\d+)", status, re.MULTILINE)
+    state = re.search(r"^State:\s+(\w)", status, re.MULTILINE)
+    return cwd, int(rss.group(1)) if rss else 0, bool(state) and state.group(1) == "R"
+
+
+def cmd_monitor(args):
+    stats = {}
+    command = args.build_command[1:] if args.build_command[:1] == ["--"] else args.build_command
+    process = subprocess.Popen(command)
+    try:
+        while process.poll() is None:
+            now = time.time()
+            sample = collections.defaultdict(lambda: [0, 0, 0])
+            for pid in os.listdir("/proc"):
+                if not pid.isdigit():
+                    continue
+                info = read_proc(pid)
+                match = info and STAGE_REGEX.search(info[0])
+                if not match:
+                    continue
+                total = sample[(match.group(1), match.group(2))]
+                total[0] += info[1]
+                total[1] = max(total[1], info[1])
+                total[2] += info[2]
+            for (stage, digest), (rss, process_rss, running) in sample.items():
+                entry = stats.setdefault(
+                    digest,
+                    {
+                        "hash": digest,
+                        "stage": stage,
+                        "start": now,
+                        "peak_rss_kb": 0,
+                        "peak_process_rss_kb": 0,
+                        "peak_running": 0,
+                        "running_samples": [],
+                    },
+                )
+                entry["end"] = now
+                entry["peak_rss_kb"] = max(entry["peak_rss_kb"], rss)
+                entry["peak_process_rss_kb"] = max(entry["peak_process_rss_kb"], process_rss)
+                entry["peak_running"] = max(entry["peak_running"], running)
+                entry["running_samples"].append(running)
+            time.sleep(args.interval)
+    finally:
+        with open(args.log, "a") as f:
+            for entry in stats.values():
+                samples = entry.pop("running_samples")
+                entry["mean_running"] = round(statistics.mean(samples), 2)
+                f.write(json.dumps(entry) + "\n")
+    sys.exit(process.returncode)
+
+
+def installed_specs(store, mount):
+    """Yield (name, version, hash, seconds) for every package in the Spack database of a store.
+
+    The database records the prefixes under the mount point that the store was
+    built for, which are moved to the store to read install_times.json.
+    """
+    for package in uenv_meta.packages(store):
+        prefix = package["prefix"]
+        if prefix == mount or prefix.startswith(mount.rstrip("/") + "/"):
+            prefix = os.path.join(store, os.path.relpath(prefix, mount))
+        seconds = None
+        times = os.path.join(prefix, ".spack", "install_times.json")
+        if os.path.exists(times):
+            with open(times) as f:
+                seconds = json.load(f).get("total", {}).get("seconds")
+        yield package["name"], package["version"], package["hash"], seconds
+
+
+def extract_store(image, mount, work):
+    """Extract the Spack database and the install_times.json of every package from a squashfs image of a store."""
+    subprocess.run(["unsquashfs", "-no-progress", "-f", "-d", work, image, uenv_meta.DATABASE], check=True)
+    files = os.path.join(work, "extract-files")
+    with open(files, "w") as f:
+        for package in uenv_meta.packages(work):
+            if package["prefix"].startswith(mount.rstrip("/") + "/"):
+                f.write(os.path.join(os.path.relpath(package["prefix"], mount), ".spack", "install_times.json") + "\n")
+    # unsquashfs ignores the lines that match no file, e.g. packages installed from a build cache
+    subprocess.run(["unsquashfs", "-no-progress", "-f", "-d", work, "-ef", files, image], check=True)
+
+
+def cmd_record(args):
+    monitored = {}
+    if args.monitor_log:
+        with open(args.monitor_log) as f:
+            for line in f:
+                entry = json.loads(line)
+                monitored[entry["hash"]] = entry
+
+    with tempfile.TemporaryDirectory(prefix="build-stats-") as work:
+        try:
+            if args.image:
+                extract_store(args.image, args.mount, work)
+            store = work if args.image else args.store
+            packages = list(installed_specs(store, args.mount))
+        except (uenv_meta.QueryError, subprocess.CalledProcessError) as e:
+            print(f"error: {e}")
+            sys.exit(1)
+
+    db = buildstats.open_db(args.db)
+    count = 0
+    for name, version, digest, seconds in packages:
+        entry = monitored.get(digest, {})
+        if seconds is None and entry:
+            seconds = entry["end"] - entry["start"]
+        if seconds is None:
+            # externals and packages installed from a build cache have no build time
+            continue
+        buildstats.insert(
+            db,
+            run=args.run,
+            uenv=args.uenv,
+            uarch=args.uarch,
+            name=name,
+            version=version,
+            hash=digest,
+            seconds=seconds,
+            peak_rss_kb=entry.get("peak_rss_kb"),
+            peak_process_rss_kb=entry.get("peak_process_rss_kb"),
+            peak_running=entry.get("peak_running"),
+            mean_running=entry.get("mean_running"),
+            jobs=args.jobs,
+        )
+        count += 1
+    db.commit()
+    print(f"recorded {count} packages from {args.image or args.store} in {args.db} as run {args.run}")
+
+
+def schedule(dag, durations, concurrency):
+    """Simulate building the DAG with at most `concurrency` packages at a time, return the makespan."""
+    remaining = {digest: set(deps) for digest, (_, _, deps) in dag.items()}
+    dependents = collections.defaultdict(list)
+    for digest, (_, _, deps) in dag.items():
+        for dep in deps:
+            dependents[dep].append(digest)
+    ready = sorted((d for d, deps in remaining.items() if not deps), key=lambda d: -durations[d])
+    running = []
+    now = 0.0
+    while ready or running:
+        while ready and len(running) < concurrency:
+            digest = ready.pop(0)
+            running.append((now + durations[digest], digest))
+        running.sort()
+        now, digest = running.pop(0)
+        for dependent in dependents[digest]:
+            remaining[dependent].discard(digest)
+            if not remaining[dependent]:
+                ready.append(dependent)
+        ready.sort(key=lambda d: -durations[d])
+    return now
+
+
+def cmd_critical_path(args):
+    lock_files = list(args.lock)
+    if args.uenv:
+        recipe = uenv_recipes.uenv_recipe_path(args.uenv, args.uarch)
+        try:
+            key = uenv_recipes.recipe_hash(recipe, uenv_recipes.UARCH_TARGETS.get(args.uarch), args.repo)
+        except RuntimeError as e:
+            print(f"error: {e}")
+            sys.exit(1)
+        entry = uenv_recipes.concretization_entry(args.cache, key)
+        lock_files += glob.glob(os.path.join(entry, "*", "spack.lock"))
+        if not lock_files:
+            print(f"error: {args.uenv} has not been concretized for {args.uarch}, run concretize-recipe.py first")
+            sys.exit(1)
+    if not lock_files:
+        print("error: give --uenv or at least one --lock")
+        sys.exit(1)
+
+    db = buildstats.open_db(args.db)
+    dag = buildstats.load_dag(lock_files)
+    durations = {}
+    unknown = []
+    for digest, (name, version, _) in dag.items():
+        durations[digest], known = buildstats.estimate(db, name, version, args.uarch)
+        if not known:
+            unknown.append(name)
+
+    # longest path through the DAG, in dependency order
+    finish = {}
+    previous = {}
+
+    def longest(digest):
+        if digest not in finish:
+            deps = dag[digest][2]
+            before = max(deps, key=longest, default=None)
+            previous[digest] = before
+            finish[digest] = (finish[before] if before else 0) + durations[digest]
+        return finish[digest]
+
+    sys.setrecursionlimit(max(1000, 4 * len(dag)))
+    last = max(dag, key=longest)
+    path = []
+    while last:
+        path.append(last)
+        last = previous[last]
+
+    print(f"critical path ({len(path)} of {len(dag)} packages):")
+    for digest in reversed(path):
+        name, version, _ = dag[digest]
+        print(f"    {durations[digest] / 60:8.1f} min  {name}@{version} /{digest[:7]}")
+
+    serial = sum(durations.values())
+    critical = finish[path[0]]
+    makespan = schedule(dag, durations, args.concurrency)
+    print(f"total build time of all packages: {serial / 3600:.2f} h")
+    print(f"critical path:                    {critical / 3600:.2f} h")
+    print(f"predicted with {args.concurrency} concurrent packages: {makespan / 3600:.2f} h")
+    print(f"suggested SLURM_TIMELIMIT:        {math.ceil(makespan * args.margin / 60)}")
+    if unknown:
+        print(f"warning: no records for {len(unknown)} packages, assumed {buildstats.DEFAULT_SECONDS}s each: {' '.join(sorted(set(unknown)))}")
+
+
+parser = argparse.ArgumentParser()
+subparsers = parser.add_subparsers(dest="command", required=True)
+
+monitor = subparsers.add_parser("monitor", help="Run a build and sample the resources used by each package")
+monitor.add_argument("--log", required=True, help="File to append the samples to, as json lines")
+monitor.add_argument("--interval", type=float, default=1.0, help="Seconds between samples")
+monitor.add_argument("build_command", nargs=argparse.REMAINDER, help="The build command, after --")
+
+record = subparsers.add_parser("record", help="Add the packages in a Spack store to the database")
+record.add_argument("--db", required=True, help="Path of the SQLite database")
+source = record.add_mutually_exclusive_group(required=True)
+source.add_argument("--store", help="Path of the Spack store, e.g. $BUILD/store")
+source.add_argument("--image", help="squashfs image of the store, e.g. from uenv image inspect --format={sqfs}")
+record.add_argument("--mount", default="/user-environment", help="Mount point that the store was built for")
+record.add_argument("--uenv", required=True, help="name:version of the uenv")
+record.add_argument("--uarch", required=True)
+record.add_argument("--monitor-log", help="Output of the monitor command for the same build")
+record.add_argument("--run", default=os.environ.get("CI_PIPELINE_ID", time.strftime("%Y%m%d-%H%M%S")))
+record.add_argument("--jobs", type=int, default=os.environ.get("SLURM_CPUS_PER_TASK"), help="build_jobs of the build")
+
+critical_path = subparsers.add_parser("critical-path", help="Find the critical path and predict the build time")
+critical_path.add_argument("--db", required=True, help="Path of the SQLite database")
+critical_path.add_argument("--uenv", help="name:version of a uenv in config.yaml")
+critical_path.add_argument("--uarch", required=True)
+critical_path.add_argument("--lock", action="append", default=[], help="spack.lock of an environment")
+critical_path.add_argument("--repo", action="append", default=[], help="--repo arguments given to concretize-recipe.py")
+critical_path.add_argument("--cache", default=uenv_recipes.CONCRETIZE_CACHE, help="Path of the concretization cache")
+critical_path.add_argument("--concurrency", type=int, default=1, help="Packages built at the same time")
+critical_path.add_argument("--margin", type=float, default=1.25, help="Safety factor for SLURM_TIMELIMIT")
+
+args = parser.parse_args()
+{
+    "monitor": cmd_monitor,
+    "record": cmd_record,
+    "critical-path": cmd_critical_path,
+}[args.command](args)
@@ -0,0 +1,96 @@
+# the SQLite database of package build statistics written by build-stats.py and build-scheduler.py
+
+import json
+import sqlite3
+import statistics
+import time
+
+# used for packages that have never been recorded
+DEFAULT_SECONDS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    run TEXT,
+    timestamp REAL,
+    uenv TEXT,
+    uarch TEXT,
+    name TEXT,
+    version TEXT,
+    hash TEXT,
+    seconds REAL,
+    peak_rss_kb INTEGER,
+    peak_process_rss_kb INTEGER,
+    peak_running INTEGER,
+    mean_running REAL,
+    jobs INTEGER,
+    PRIMARY KEY (run, hash)
+);
+CREATE INDEX IF NOT EXISTS builds_name ON builds (name, uarch);
+"""
+
+
+COLUMNS = [
+    "run",
+    "timestamp",
+    "uenv",
+    "uarch",
+    "name",
+    "version",
+    "hash",
+    "seconds",
+    "peak_rss_kb",
+    "peak_process_rss_kb",
+    "peak_running",
+    "mean_running",
+    "jobs",
+]
+
+
+def open_db(path):
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def insert(db, **values):
+    """Add or replace the record of one package build, missing columns are NULL."""
+    values.setdefault("timestamp", time.time())
+    db.execute(
+        f"INSERT OR REPLACE INTO builds VALUES ({', '.join('?' * len(COLUMNS))})",
+        [values.get(column) for column in COLUMNS],
+    )
+
+
+def estimate(db, name, version, uarch):
+    """Return the expected build time of a package: the median of the matching records."""
+    queries = [
+        ("SELECT seconds FROM builds WHERE name=? AND version=? AND uarch=?", (name, version, uarch)),
+        ("SELECT seconds FROM builds WHERE name=? AND uarch=?", (name, uarch)),
+        ("SELECT seconds FROM builds WHERE name=?", (name,)),
+    ]
+    for query, params in queries:
+        rows = [row[0] for row in db.execute(query, params)]
+        if rows:
+            return statistics.median(rows), True
+    return DEFAULT_SECONDS, False
+
+
+def load_dag(lock_files):
+    """Return {hash: (name, version, [dependency hashes])} for the specs that are built in a set of spack.lock files."""
+    dag = {}
+    for path in lock_files:
+        with open(path) as f:
+            specs = json.load(f)["concrete_specs"]
+        for digest, spec in specs.items():
+            if spec.get("external"):
+                continue
+            dependencies = [dep["hash"] for dep in spec.get("dependencies", [])]
+            dag[digest] = (spec["name"], str(spec.get("version", "")), dependencies)
+    # drop dependencies on externals
+    return {digest: (name, version, [d for d in deps if d in dag]) for digest, (name, version, deps) in dag.items()}
+
+
+def process_memory(db, name):
+    """Return the largest recorded memory use of a single process building a package, in kB, or None."""
+    row = db.execute("SELECT MAX(peak_process_rss_kb) FROM builds WHERE name=?", (name,)).fetchone()
+    return row[0]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# Measure the NCCL collectives with nccl-tests, and compare them with, or write
+# them as, the reference performance of a network profile.
+#
+# usage:
+#   # in an allocation of 8 nodes, with a uenv that provides nccl-tests loaded
+#   python3 collectives-reference.py --profile alps-gh200                 # compare with the reference
+#   python3 collectives-reference.py --profile alps-gh200 --nodes 1 2     # only some of the node counts
+#   python3 collectives-reference.py --profile alps-gh200 --update        # write the measurements as the reference
+#
+# Every test in the collectives section of the profile, e.g. all_reduce, is run
+# as <test>_perf on every node count of the section. The bus bandwidth of the
+# largest message and the time of the smallest message are compared with the
+# reference: a bandwidth lower, or a time higher, than the reference by more
+# than the tolerance of the profile is a regression, and the script exits 1.
+# A test without a reference, null until it is measured with --update, is
+# reported with the status "no reference", and is not a failure.
+#
+# After --update, write the reference into the reframe.yaml of the recipes with
+# network-profile.py.
+
+import argparse
+import shlex
+import statistics
+import subprocess
+import sys
+
+import netprofile
+
+DEFAULT_LAUNCHER = "srun -N {nodes} --ntasks-per-node 4 --gpus-per-task 1"
+DEFAULT_ARGS = "-b 8 -e 1G -f 2 -g 1"
+
+
+def measure(test, nodes, args):
+    """Return the median (bus bandwidth of the largest message, time of the smallest) of a test, or None."""
+    command = shlex.split(args.launcher.format(nodes=nodes)) + [f"{test}_perf"] + shlex.split(args.args)
+    busbw, latency = [], []
+    for _ in range(args.repeat):
+        result = subprocess.run(command, capture_output=True, text=True)
+        parsed = netprofile.parse_nccl(result.stdout) if result.returncode == 0 else None
+        if parsed is None:
+            return None
+        rows = parsed[1]
+        busbw.append(rows[-1][2])
+        latency.append(rows[0][1])
+    return round(statistics.median(busbw), 2), round(statistics.median(latency), 2)
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--profile", required=True, help="Name of the profile in recipes/common/network")
+parser.add_argument("--nodes", type=int, nargs="+", help="Node counts to run (default: all node counts of the profile)")
+parser.add_argument("--launcher", default=DEFAULT_LAUNCHER, help=f"Launcher, {{nodes}} is the node count (default: {DEFAULT_LAUNCHER})")
+parser.add_argument("--args", default=DEFAULT_ARGS, help=f"Arguments of the tests (default: {DEFAULT_ARGS})")
+parser.add_argument("--repeat", type=int, default=3, help="Runs of each test")
+parser.add_argument("--update", action="store_true", help="Write the measurements to the profile as the reference")
+args = parser.parse_args()
+
+profile = netprofile.load_profile(args.profile)
+collectives = profile.get("collectives")
+if not collectives:
+    print(f"error: {args.profile} has no collectives section")
+    sys.exit(1)
+tolerance = collectives["tolerance"]
+
+failed = []
+for test, references in collectives["tests"].items():
+    for nodes, reference in references.items():
+        if args.nodes and nodes not in args.nodes:
+            continue
+        label = f"{test} {nodes} nodes"
+        result = measure(test, nodes, args)
+        if result is None:
+            print(f"{label}: FAILED")
+            failed.append(label)
+            continue
+        busbw, latency = result
+        status = ""
+        regressions = []
+        if reference["busbw"] is not None and busbw < reference["busbw"] * (1 - tolerance):
+            regressions.append("bandwidth")
+        if reference["latency"] is not None and latency > reference["latency"] * (1 + tolerance):
+            regressions.append("latency")
+        if regressions:
+            status = f" REGRESSION of the {' and '.join(regressions)}"
+            failed.append(label)
+        elif None in [reference["busbw"], reference["latency"]] and not args.update:
+            status = " no reference, set it with --update"
+        print(
+            f"{label}: busbw {busbw:.2f} GB/s (reference {reference['busbw']}), "
+            f"latency {latency:.2f} us (reference {reference['latency']})" + status
+        )
+        if args.update:
+            references[nodes] = {"busbw": busbw, "latency": latency}
+
+if args.update:
+    path = netprofile.profile_path(args.profile)
+    netprofile.write_profile(path, profile, path)
+    print(f"wrote the reference to {path}, update the recipes with network-profile.py")
+elif failed:
+    sys.exit(1)
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+
+# Concretize every environment of a recipe locally, without a build node.
+#
+# Results are cached on disk, keyed by a hash of the recipe's environments.yaml,
+# compilers.yaml, packages.yaml, repo overrides and pinned Spack commits, so
+# checking a recipe that has not changed since the last check returns immediately.
+# Only a recipe whose environments all concretize is cached: a failure is checked
+# again on the next run, since it can come from the network or the bootstrap.
+# A branch or tag in the commit: of config.yaml is resolved to its SHA with
+# git ls-remote first, so that a branch that moves is concretized again.
+#
+# usage:
+#   python3 concretize-recipe.py recipes/cp2k/2026.1/gh200
+#   python3 concretize-recipe.py --uenv cp2k:2026.1 --uarch gh200
+#
+# Spack and, for recipes with version: 2, the spack-packages repository are
+# checked out at the commits pinned in the recipe's config.yaml. When --mirror
+# (or UENV_GIT_MIRROR) is set, they are cloned from <mirror>/spack.git and
+# <mirror>/spack-packages.git instead of GitHub, so that no network access is
+# required. The clingo bootstrap must then also be available offline, e.g. by
+# running `spack bootstrap mirror --binary-packages` once and pointing
+# SPACK_BOOTSTRAP_MIRROR at the result.
+#
+# cray-mpich and other packages provided by the cluster configuration are not
+# in the Spack builtin repository: pass the paths of the repositories that
+# provide them with --repo.
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import yaml
+
+import uenv_recipes
+
+# names of the compiler executables used for placeholder compiler definitions
+COMPILER_PATHS = {
+    "gcc": {"c": "gcc", "cxx": "g++", "fortran": "gfortran"},
+    "llvm": {"c": "clang", "cxx": "clang++", "fortran": "flang"},
+    "nvhpc": {"c": "nvc", "cxx": "nvc++", "fortran": "nvfortran"},
+    "intel-oneapi-compilers": {"c": "icx", "cxx": "icpx", "fortran": "ifx"},
+    "llvm-amdgpu": {"c": "amdclang", "cxx": "amdclang++", "fortran": "amdflang"},
+}
+
+
+def read_yaml(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r") as stream:
+        return yaml.safe_load(stream)
+
+
+def checkout(url, commit, cache, mirror):
+    """Return the path of a checkout of url at commit, a SHA from resolve_ref, cloning it if required."""
+    name = os.path.basename(url.rstrip("/"))
+    path = os.path.join(cache, "checkouts", f"{name[:-4] if name.endswith('.git') else name}-{commit.replace('/', '-')}")
+    if os.path.isdir(path):
+        return path
+    source = uenv_recipes.git_source(url, mirror)
+    print(f"==> cloning {source} at {commit}")
+    tmp = path + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        subprocess.run(["git", "clone", "--quiet", "--no-checkout", source, tmp], check=True)
+        subprocess.run(["git", "-C", tmp, "-c", "advice.detachedHead=false", "checkout", "--quiet", commit], check=True)
+    except subprocess.CalledProcessError:
+        print(f"error: unable to check out {commit} from {source}")
+        sys.exit(1)
+    os.rename(tmp, path)
+    return path
+
+
+def compiler_specs(compilers):
+    """Return {name: spec} for the compilers declared in compilers.yaml."""
+    specs = {}
+    for key, value in compilers.items():
+        if "version" in value:
+            # version: 2 recipes give the version of each compiler
+            specs[key] = f"{key}@{value['version']}"
+        for spec in value.get("specs", [value["spec"]] if "spec" in value else []):
+            name = spec.split("@")[0]
+            if key != "bootstrap" or name not in specs:
+                specs[name] = spec
+    return specs
+
+
+def compiler_names(env):
+    names = []
+    for compiler in env.get("compiler", []):
+        if isinstance(compiler, dict):
+            names.append(compiler["spec"])
+        else:
+            names.append(compiler)
+    return names
+
+
+def placeholder_compilers(env, compilers, operating_system):
+    """compilers: section for Spack 0.x, with paths that are never used by the concretizer."""
+    entries = []
+    available = compiler_specs(compilers)
+    for spec in compiler_names(env):
+        name = spec.split("@")[0]
+        if "@" not in spec:
+            spec = available.get(name, f"{name}@0")
+        paths = COMPILER_PATHS.get(name, COMPILER_PATHS["gcc"])
+        entries.append(
+            {
+                "compiler": {
+                    "spec": spec,
+                    "paths": {
+                        "cc": f"/usr/bin/{paths['c']}",
+                        "cxx": f"/usr/bin/{paths['cxx']}",
+                        "f77": f"/usr/bin/{paths['fortran']}",
+                        "fc": f"/usr/bin/{paths['fortran']}",
+                    },
+                    "operating_system": operating_system,
+                    "modules": [],
+                }
+            }
+        )
+    return entries
+
+
+def placeholder_compiler_packages(env, compilers):
+    """Compilers are external packages in Spack 1.x."""
+    packages = {}
+    available = compiler_specs(compilers)
+    names = compiler_names(env)
+    for name in names:
+        spec = available.get(name, f"{name}@0")
+        paths = COMPILER_PATHS.get(name, COMPILER_PATHS["gcc"])
+        packages[name] = {
+            "buildable": False,
+            "externals": [
+                {
+                    "spec": f"{spec} languages:=c,c++,fortran",
+                    "prefix": "/usr",
+                    "extra_attributes": {"compilers": {k: f"/usr/bin/{v}" for k, v in paths.items()}},
+                }
+            ],
+        }
+    if names:
+        for language in ["c", "cxx", "fortran"]:
+            packages[language] = {"require": [names[0]]}
+    return packages
+
+
+def make_repo(recipe, workdir, version):
+    """Copy the recipe's repo overrides into a Spack package repository, following symlinks."""
+    source = os.path.join(recipe, "repo", "packages")
+    if not os.path.isdir(source):
+        return None
+    if version == 2:
+        path = os.path.join(workdir, "repo", "spack_repo", "alps")
+        description = {"repo": {"namespace": "alps", "api": "v2.0"}}
+    else:
+        path = os.path.join(workdir, "repo")
+        description = {"repo": {"namespace": "alps"}}
+    shutil.rmtree(os.path.join(workdir, "repo"), ignore_errors=True)
+    shutil.copytree(source, os.path.join(path, "packages"))
+    with open(os.path.join(path, "repo.yaml"), "w") as f:
+        yaml.dump(description, f)
+    return path
+
+
+def environment_config(env, recipe_packages, compilers, repos, args):
+    if env.get("network"):
+        mpi = env["network"].get("mpi")
+    elif env.get("mpi"):
+        mpi = env["mpi"]["spec"] + (f" +{env['mpi']['gpu']}" if env["mpi"].get("gpu") else "")
+    else:
+        mpi = None
+    specs = list(env["specs"]) + ([mpi] if mpi else [])
+
+    packages = dict(recipe_packages)
+    packages.setdefault("all", {})
+    packages["all"] = dict(packages["all"])
+    if env.get("variants"):
+        packages["all"]["variants"] = list(env["variants"])
+    if args.target:
+        packages["all"]["require"] = list(packages["all"].get("require", [])) + [f"target={args.target}"]
+
+    config = {
+        "specs": specs,
+        "view": False,
+        "concretizer": {"unify": env.get("unify", True), "reuse": False},
+        "packages": packages,
+    }
+    if args.version == 2:
+        config["packages"].update(placeholder_compiler_packages(env, compilers))
+        config["repos"] = dict({f"repo{i}": repo for i, repo in enumerate(repos)}, builtin=args.builtin)
+    else:
+        config["compilers"] = placeholder_compilers(env, compilers, args.operating_system)
+        config["repos"] = repos
+    return {"spack": config}
+
+
+def concretize(spack, path, env_vars):
+    start = time.time()
+    result = subprocess.run(
+        [spack, "-e", path, "concretize", "--fresh"],
+        env=env_vars,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return {
+        "success": result.returncode == 0,
+        "seconds": round(time.time() - start, 1),
+        "output": result.stdout.splitlines()[-50:],
+    }
+
+
+def print_result(result, cached):
+    label = "cached" if cached else "concretized"
+    for name, env in result["environments"].items():
+        status = "ok" if env["success"] else "FAILED"
+        print(f"{name}: {status} ({label}, {env['seconds']}s)")
+        if not env["success"]:
+            print("\n".join(f"    {line}" for line in env["output"]))
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("recipe", nargs="?", help="Path of the recipe")
+parser.add_argument("--uenv", help="name:version of a uenv in config.yaml, used with --uarch instead of a recipe path")
+parser.add_argument("--uarch", help="uarch of the recipe to use, and Spack target to concretize for")
+parser.add_argument("--target", help="Spack target to concretize for (default: derived from --uarch)")
+parser.add_argument("--mirror", default=os.environ.get("UENV_GIT_MIRROR"), help="Path with git mirrors of Spack")
+parser.add_argument("--repo", action="append", default=[], help="Additional Spack package repository")
+parser.add_argument("--cache", default=uenv_recipes.CONCRETIZE_CACHE, help="Path of the concretization cache")
+parser.add_argument("--force", action="store_true", help="Concretize even if the result is cached")
+args = parser.parse_args()
+
+if args.uenv:
+    if not args.uarch:
+        parser.error("--uenv requires --uarch")
+    args.recipe = uenv_recipes.uenv_recipe_path(args.uenv, args.uarch)
+if not args.recipe:
+    parser.error("a recipe path or --uenv is required")
+if not args.target and args.uarch:
+    args.target = uenv_recipes.UARCH_TARGETS.get(args.uarch)
+
+recipe = os.path.abspath(args.recipe)
+config = read_yaml(os.path.join(recipe, "config.yaml"))
+args.version = config.get("version", 1)
+args.repo = [os.path.abspath(path) for path in args.repo]
+
+try:
+    spack_commit = uenv_recipes.resolve_ref(config["spack"]["repo"], config["spack"]["commit"], args.mirror)
+    if args.version == 2:
+        packages_commit = uenv_recipes.resolve_ref(
+            config["spack"]["packages"]["repo"], config["spack"]["packages"]["commit"], args.mirror
+        )
+    key = uenv_recipes.recipe_hash(recipe, args.target, args.repo, args.mirror)
+except RuntimeError as e:
+    print(f"error: {e}")
+    sys.exit(1)
+entry = uenv_recipes.concretization_entry(args.cache, key)
+result_path = os.path.join(entry, "result.json")
+
+print(f"==> recipe {os.path.relpath(recipe)} has hash {key[:16]}")
+if os.path.exists(result_path) and not args.force:
+    with open(result_path) as f:
+        result = json.load(f)
+    print_result(result, cached=True)
+    sys.exit(0 if all(env["success"] for env in result["environments"].values()) else 1)
+
+spack_root = checkout(config["spack"]["repo"], spack_commit, args.cache, args.mirror)
+spack = os.path.join(spack_root, "bin", "spack")
+if args.version == 2:
+    packages_root = checkout(config["spack"]["packages"]["repo"], packages_commit, args.cache, args.mirror)
+    args.builtin = os.path.join(packages_root, "repos", "spack_repo", "builtin")
+
+env_vars = dict(
+    os.environ,
+    SPACK_DISABLE_LOCAL_CONFIG="1",
+    SPACK_USER_CACHE_PATH=os.path.join(args.cache, "spack-user-cache"),
+)
+if args.version != 2:
+    args.operating_system = subprocess.run(
+        [spack, "arch", "--operating-system"], env=env_vars, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+# result.json is written last, so an interrupted run is not mistaken for a cached result
+workdir = entry
+shutil.rmtree(workdir, ignore_errors=True)
+os.makedirs(workdir)
+
+repos = [path for path in [make_repo(recipe, workdir, args.version)] if path] + args.repo
+environments = read_yaml(os.path.join(recipe, "environments.yaml"))
+compilers = read_yaml(os.path.join(recipe, "compilers.yaml"), {})
+recipe_packages = read_yaml(os.path.join(recipe, "packages.yaml"), {}).get("packages", {})
+
+result = {
+    "recipe": os.path.relpath(recipe, uenv_recipes.REPO_ROOT),
+    "target": args.target,
+    "hash": key,
+    "environments": {},
+}
+for name, env in environments.items():
+    path = os.path.join(workdir, name)
+    os.makedirs(path)
+    with open(os.path.join(path, "spack.yaml"), "w") as f:
+        yaml.dump(environment_config(env, recipe_packages, compilers, repos, args), f, sort_keys=False)
+    print(f"==> concretizing {name}")
+    result["environments"][name] = concretize(spack, path, env_vars)
+
+print_result(result, cached=False)
+if not all(env["success"] for env in result["environments"].values()):
+    # a failure can be transient, e.g. a failed fetch of the bootstrap, so it is not cached
+    print(f"==> not cached, the environments are in {workdir}")
+    sys.exit(1)
+with open(result_path, "w") as f:
+    json.dump(result, f, indent=2)
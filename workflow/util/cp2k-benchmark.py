@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+# Run the CP2K benchmark inputs of a recipe in every environment of the uenv,
+# ELPA and DLA-Future, compare the times with the reference of the system, and
+# report the faster eigensolver of every case.
+#
+# usage:
+#   # in an allocation of two nodes, with the cp2k uenv mounted
+#   python3 cp2k-benchmark.py --system gh200
+#   python3 cp2k-benchmark.py --system gh200 --cases h2o-256-diag --environments run-dlaf
+#   python3 cp2k-benchmark.py --system gh200 --update --inputs recipes/common/benchmarks/cp2k
+#
+# The inputs are read from /user-environment/meta/extra/benchmarks, or --inputs.
+# benchmarks.yaml lists the environments, the view with cp2k.psmp and the
+# eigensolver of each, and the cases, with the input, the number of nodes and
+# the reference of each system and environment. The eigensolver is set with the
+# "@SET DIAG_LIBRARY" line of the input, and the view is loaded from the
+# meta/env.json of --store.
+#
+# Every case runs --repeat times in every environment, and the median elapsed
+# time is read from the timing report of CP2K. A time higher than the reference
+# by more than the tolerance is a regression, and the script exits 1. With
+# --update, the times are written as the reference of the system instead.
+
+import argparse
+import os
+import re
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import yaml
+
+import uenv_recipes
+
+sys.path.insert(0, os.path.join(uenv_recipes.RECIPES_ROOT, "common", "scripts"))
+import uenv_meta  # noqa: E402
+
+DEFAULT_INPUTS = "/user-environment/meta/extra/benchmarks"
+DEFAULT_LAUNCHER = "srun -N {nodes} --ntasks-per-node 4 --cpus-per-task 72 --gpus-per-task 1"
+
+# the total time of the CP2K timer: CP2K  1  1.0  <self avg> <self max> <total avg> <total max>
+TIMER_REGEX = re.compile(r"^\s*CP2K\s+1\s+\S+\s+\S+\s+\S+\s+\S+\s+([0-9.]+)\s*$", re.MULTILINE)
+
+
+def run(config, environment, variables, args):
+    """Return the median elapsed time of a case in an environment, or None if a run fails."""
+    times = []
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory(prefix="cp2k-") as work:
+            for name in os.listdir(args.inputs):
+                if name.endswith((".inp", ".xyz")):
+                    shutil.copy(os.path.join(args.inputs, name), work)
+            filter_input(os.path.join(work, config["input"]), environment["diag_library"])
+            command = shlex.split(args.launcher.format(nodes=config["nodes"]))
+            command += ["cp2k.psmp", "-i", config["input"], "-o", "cp2k.out"]
+            result = subprocess.run(command, cwd=work, env=variables, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            output = os.path.join(work, "cp2k.out")
+            match = None
+            if result.returncode == 0 and os.path.exists(output):
+                with open(output) as f:
+                    match = TIMER_REGEX.search(f.read())
+        if match is None:
+            return None
+        times.append(float(match.group(1)))
+    return round(statistics.median(times), 1)
+
+
+def filter_input(path, diag_library):
+    with open(path) as f:
+        text = f.read()
+    text, count = re.subn(r"^@SET DIAG_LIBRARY .*$", f"@SET DIAG_LIBRARY {diag_library}", text, flags=re.MULTILINE)
+    if count != 1:
+        print(f"error: {os.path.basename(path)} has no '@SET DIAG_LIBRARY' line")
+        sys.exit(1)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def write_references(path, system, results):
+    """Write the times of the system into benchmarks.yaml, keeping the comments and the other references."""
+    with open(path) as f:
+        lines = f.readlines()
+    case = None
+    for i, line in enumerate(lines):
+        match = re.match(r"^  ([\w-]+):", line)
+        if match:
+            case = match.group(1)
+        match = re.match(rf"^(\s+{re.escape(system)}:\s*)(\{{.*\}})(.*)$", line)
+        if match and case in results:
+            references = dict(yaml.safe_load(match.group(2)), **results[case])
+            values = ", ".join(f"{name}: {'null' if time is None else time}" for name, time in references.items())
+            lines[i] = f"{match.group(1)}{{{values}}}{match.group(3)}\n"
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--system", required=True, help="System of the reference in benchmarks.yaml, e.g. gh200")
+parser.add_argument("--inputs", default=DEFAULT_INPUTS, help=f"Directory of benchmarks.yaml (default: {DEFAULT_INPUTS})")
+parser.add_argument("--store", default="/user-environment", help="Mount point of the uenv, with the views of the environments")
+parser.add_argument("--cases", nargs="+", help="Cases to run (default: all)")
+parser.add_argument("--environments", nargs="+", help="Environments to run (default: all)")
+parser.add_argument("--launcher", default=DEFAULT_LAUNCHER, help=f"Launcher, {{nodes}} is the node count of the case (default: {DEFAULT_LAUNCHER})")
+parser.add_argument("--threads", type=int, default=64, help="OpenMP threads per rank (default: 64)")
+parser.add_argument("--repeat", type=int, default=1, help="Runs of each case")
+parser.add_argument("--update", action="store_true", help="Write the times to benchmarks.yaml as the reference of the system")
+args = parser.parse_args()
+
+path = os.path.join(args.inputs, "benchmarks.yaml")
+with open(path) as f:
+    benchmarks = yaml.safe_load(f)
+tolerance = benchmarks["tolerance"]
+for name, available in [("cases", benchmarks["cases"]), ("environments", benchmarks["environments"])]:
+    for value in getattr(args, name) or []:
+        if value not in available:
+            print(f"error: {value} is not one of the {name} of {path}: {', '.join(available)}")
+            sys.exit(1)
+try:
+    views = uenv_meta.load_env(args.store)["views"]
+except OSError as e:
+    print(f"error: the views of {args.store}: {e}")
+    sys.exit(1)
+
+failed = []
+results = {}
+for case, config in benchmarks["cases"].items():
+    if args.cases and case not in args.cases:
+        continue
+    reference = config.get(args.system) or {}
+    print(f"{case} ({config['input']}, {config['nodes']} nodes)")
+    times = {}
+    for name, environment in benchmarks["environments"].items():
+        if args.environments and name not in args.environments:
+            continue
+        variables = uenv_meta.view_environment(views[environment["view"]])
+        variables["OMP_NUM_THREADS"] = str(args.threads)
+        time = run(config, environment, variables, args)
+        if time is None:
+            print(f"  {name} ({environment['diag_library']}): FAILED")
+            failed.append(f"{case} {name}")
+            continue
+        times[name] = time
+        regression = reference.get(name) is not None and time > reference[name] * (1 + tolerance)
+        print(
+            f"  {name} ({environment['diag_library']}): {time:.1f} s, reference {reference.get(name)}"
+            + (" REGRESSION" if regression else "")
+        )
+        if regression:
+            failed.append(f"{case} {name}")
+    if len(times) > 1:
+        fastest = min(times, key=times.get)
+        slowest = max(times, key=times.get)
+        print(
+            f"  faster: {fastest} ({benchmarks['environments'][fastest]['diag_library']}), "
+            f"{times[slowest] / times[fastest]:.2f}x {slowest}"
+        )
+    results[case] = times
+
+if args.update:
+    write_references(path, args.system, results)
+    print(f"wrote the reference of {args.system} to {path}")
+elif failed:
+    sys.exit(1)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# Autotune the libsmm_acc GPU kernels of DBCSR for the block sizes of a recipe,
+# and write the table of parameters of the GPU for the dbcsr package of the
+# recipe. No dbcsr package builds with such a table yet: the package change is
+# made together with the first table measured on the GPU.
+#
+# usage:
+#   git clone -b v2.8.0 https://github.com/cp2k/dbcsr.git
+#   python3 dbcsr-autotune.py setup --recipe recipes/cp2k/2025.1/gh200 --dbcsr dbcsr
+#   python3 dbcsr-autotune.py run --recipe recipes/cp2k/2025.1/gh200 --dbcsr dbcsr       # submit a job per triplet
+#   python3 dbcsr-autotune.py collect --recipe recipes/cp2k/2025.1/gh200 --dbcsr dbcsr   # when the jobs are done
+#
+# The configuration dbcsr-autotune.yaml, next to config.yaml of the recipe,
+# gives the name of the parameters, the DBCSR version, the block sizes to tune
+# and the base parameters of DBCSR that the tuned ones extend:
+#
+#   name: GH200
+#   dbcsr: "2.8.0"
+#   base: A100
+#   blocksizes: [4, 5, 6, 9, 13, 14, 22, 23, 26, 32]
+#
+# setup runs tune_setup.py of DBCSR in src/acc/libsmm_acc/tune of the sources,
+# which creates a directory with a batch job for every (m, n, k) triplet of the
+# block sizes, run submits the jobs, by default with sbatch, and collect runs
+# tune_collect.py, and writes the fastest parameters of every triplet, with
+# those of the base for the triplets that are not tuned, to
+# repo/packages/dbcsr/parameters/parameters_<name>.json of the recipe. The
+# dbcsr package of the recipe has to be a private copy for that: unfold the
+# shared override with fold-overrides.py first.
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+
+import yaml
+
+TUNE_DIR = os.path.join("src", "acc", "libsmm_acc", "tune")
+PARAMETERS_DIR = os.path.join("src", "acc", "libsmm_acc", "parameters")
+
+
+def source_version(dbcsr):
+    """Return the version of the DBCSR sources, from the VERSION file."""
+    with open(os.path.join(dbcsr, "VERSION")) as f:
+        fields = dict(re.findall(r"^(MAJOR|MINOR|PATCH)\s*=\s*(\d+)", f.read(), re.MULTILINE))
+    return ".".join(fields[field] for field in ["MAJOR", "MINOR", "PATCH"])
+
+
+def key(parameters):
+    return (parameters["m"], parameters["n"], parameters["k"])
+
+
+def cmd_setup(args, config, tune_dir):
+    base = os.path.join("..", "parameters", f"parameters_{config['base']}.json")
+    command = ["python3", "tune_setup.py", "-p", base] + [str(size) for size in config["blocksizes"]]
+    print(" ".join(command))
+    subprocess.run(command, cwd=tune_dir, check=True)
+
+
+def cmd_run(args, config, tune_dir):
+    jobs = sorted(glob.glob(os.path.join(tune_dir, "tune_*x*x*", "tune_*.job")))
+    if not jobs:
+        print(f"error: no jobs in {tune_dir}, run setup first")
+        sys.exit(1)
+    for job in jobs:
+        subprocess.run(shlex.split(args.submit) + [os.path.basename(job)], cwd=os.path.dirname(job), check=True)
+    print(f"{len(jobs)} jobs submitted with {args.submit}")
+
+
+def cmd_collect(args, config, tune_dir):
+    package = os.path.join(args.recipe, "repo", "packages", "dbcsr")
+    if os.path.islink(package) or not os.path.isdir(package):
+        print(f"error: {package} is not a private copy of the dbcsr package, run fold-overrides.py unfold {package}")
+        sys.exit(1)
+    subprocess.run(["python3", "tune_collect.py"], cwd=tune_dir, check=True)
+    tuned_path = os.path.join(tune_dir, "parameters.json")
+    if not os.path.exists(tuned_path):
+        print(f"error: tune_collect.py did not write {tuned_path}")
+        sys.exit(1)
+    with open(tuned_path) as f:
+        tuned = {key(p): p for p in json.load(f)}
+    with open(os.path.join(args.dbcsr, PARAMETERS_DIR, f"parameters_{config['base']}.json")) as f:
+        parameters = {key(p): p for p in json.load(f)}
+
+    missing = [t for t in itertools.product(sorted(config["blocksizes"]), repeat=3) if t not in tuned]
+    if missing:
+        print(f"warning: {len(missing)} triplets were not tuned, e.g. {'x'.join(map(str, missing[0]))}")
+    parameters.update(tuned)
+
+    output = os.path.join(package, "parameters", f"parameters_{config['name']}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump([parameters[t] for t in sorted(parameters)], f, indent=2)
+        f.write("\n")
+    print(f"{output}: {len(tuned)} tuned triplets, {len(parameters) - len(tuned)} from {config['base']}")
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("command", choices=["setup", "run", "collect"])
+parser.add_argument("--recipe", required=True, help="Recipe with a dbcsr-autotune.yaml, e.g. recipes/cp2k/2025.1/gh200")
+parser.add_argument("--dbcsr", required=True, help="Checkout of the DBCSR sources of the version in the configuration")
+parser.add_argument("--submit", default="sbatch", help="Command that runs a job script (default: sbatch)")
+args = parser.parse_args()
+
+path = os.path.join(args.recipe, "dbcsr-autotune.yaml")
+if not os.path.exists(path):
+    print(f"error: {path} does not exist")
+    sys.exit(1)
+with open(path) as f:
+    config = yaml.safe_load(f)
+version = source_version(args.dbcsr)
+if version != config["dbcsr"]:
+    print(f"error: {args.dbcsr} is DBCSR {version}, {path} tunes {config['dbcsr']}")
+    sys.exit(1)
+
+{
+    "setup": cmd_setup,
+    "run": cmd_run,
+    "collect": cmd_collect,
+}[args.command](args, config, os.path.join(args.dbcsr, TUNE_DIR))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# Fold byte-identical repo/packages/<name> overrides into the shared store in
+# recipes/common/packages/<name>/<hash>, and replace every copy with a relative
+# symlink into the store.
+#
+# usage:
+#   python3 fold-overrides.py scan          # list duplicated overrides (default)
+#   python3 fold-overrides.py fold          # move duplicates into the store
+#   python3 fold-overrides.py check         # verify the store, for use in CI
+#   python3 fold-overrides.py unfold <path> # replace a symlink with a private copy to edit it
+#
+# Entries in the store are never modified in place: the directory name is the
+# hash of its contents. To change a shared override, unfold it in the recipes
+# that need the change, edit the copies, then run fold again.
+
+import argparse
+import collections
+import os
+import shutil
+import sys
+
+import uenv_recipes
+from uenv_recipes import HASH_LENGTH
+
+
+def store_path(recipes_root):
+    return os.path.join(recipes_root, "common", "packages")
+
+
+def is_folded(path, recipes_root):
+    if not os.path.islink(path):
+        return False
+    target = os.path.realpath(path)
+    return target.startswith(os.path.realpath(store_path(recipes_root)) + os.sep)
+
+
+def store_entries(recipes_root):
+    """Return {(name, hash): path} for every entry in the store."""
+    entries = {}
+    store = store_path(recipes_root)
+    if not os.path.isdir(store):
+        return entries
+    for name in sorted(os.listdir(store)):
+        for digest in sorted(os.listdir(os.path.join(store, name))):
+            entries[(name, digest)] = os.path.join(store, name, digest)
+    return entries
+
+
+def duplicates(recipes_root):
+    """Group the overrides that are not yet folded by (name, hash)."""
+    groups = collections.defaultdict(list)
+    for path in uenv_recipes.package_overrides(recipes_root):
+        if os.path.islink(path):
+            continue
+        digest = uenv_recipes.hash_tree(path)[:HASH_LENGTH]
+        groups[(os.path.basename(path), digest)].append(path)
+    return groups
+
+
+def foldable(recipes_root):
+    """Return the groups that should be folded: duplicated, or already present in the store."""
+    stored = store_entries(recipes_root)
+    return {
+        key: paths
+        for key, paths in sorted(duplicates(recipes_root).items())
+        if len(paths) > 1 or key in stored
+    }
+
+
+def link(path, target):
+    shutil.rmtree(path)
+    os.symlink(os.path.relpath(target, os.path.dirname(path)), path)
+
+
+def cmd_scan(args):
+    groups = foldable(args.recipes)
+    for (name, digest), paths in groups.items():
+        print(f"{name} {digest} ({len(paths)} copies)")
+        for path in paths:
+            print(f"    {os.path.relpath(path, args.recipes)}")
+    count = sum(len(paths) for paths in groups.values())
+    print(f"{count} overrides can be folded into {len(groups)} shared entries")
+
+
+def cmd_fold(args):
+    for (name, digest), paths in foldable(args.recipes).items():
+        target = os.path.join(store_path(args.recipes), name, digest)
+        if not os.path.isdir(target):
+            print(f"adding {name}/{digest} to the store")
+            shutil.copytree(paths[0], target)
+        for path in paths:
+            print(f"    linking {os.path.relpath(path, args.recipes)}")
+            link(path, target)
+
+
+def cmd_check(args):
+    errors = []
+    referenced = set()
+    for path in uenv_recipes.package_overrides(args.recipes):
+        if not is_folded(path, args.recipes):
+            continue
+        target = os.path.realpath(path)
+        if not os.path.isdir(target):
+            errors.append(f"{path}: dangling link to {target}")
+            continue
+        referenced.add(target)
+        if os.path.basename(os.path.dirname(target)) != os.path.basename(path):
+            errors.append(f"{path}: links to the override of another package {target}")
+
+    for (name, digest), path in store_entries(args.recipes).items():
+        actual = uenv_recipes.hash_tree(path)[:HASH_LENGTH]
+        if actual != digest:
+            errors.append(f"{path}: contents have been modified (hash is {actual}), use unfold to edit shared overrides")
+        if os.path.realpath(path) not in referenced:
+            print(f"warning: {name}/{digest} is not used by any recipe")
+
+    for (name, digest), paths in foldable(args.recipes).items():
+        errors.append(f"{name} {digest}: {len(paths)} identical copies have not been folded")
+
+    for error in errors:
+        print(f"error: {error}")
+    if errors:
+        print("run fold-overrides.py fold to update the store")
+        sys.exit(1)
+    print("shared package store is consistent")
+
+
+def cmd_unfold(args):
+    for path in args.paths:
+        if not is_folded(path, args.recipes):
+            print(f"error: {path} is not a link into {store_path(args.recipes)}")
+            sys.exit(1)
+        target = os.path.realpath(path)
+        os.unlink(path)
+        shutil.copytree(target, path)
+        print(f"{path} is now a private copy of {os.path.relpath(target, args.recipes)}")
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-r", "--recipes", default=uenv_recipes.RECIPES_ROOT, help="Path of the recipes tree")
+subparsers = parser.add_subparsers(dest="command")
+subparsers.add_parser("scan", help="List overrides that can be folded")
+subparsers.add_parser("fold", help="Move duplicated overrides into the store")
+subparsers.add_parser("check", help="Verify the store and the links into it")
+unfold = subparsers.add_parser("unfold", help="Replace links into the store with a private copy")
+unfold.add_argument("paths", nargs="+", help="repo/packages/<name> paths to unfold")
+args = parser.parse_args()
+args.recipes = os.path.abspath(args.recipes)
+
+{
+    None: cmd_scan,
+    "scan": cmd_scan,
+    "fold": cmd_fold,
+    "check": cmd_check,
+    "unfold": cmd_unfold,
+}[args.command](args)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+# Find the uenv build jobs affected by the changes between a previous commit and
+# HEAD, which must be checked out.
+#
+# A changed file affects every recipe that contains it, including files reached
+# through symlinks such as shared repo directories and the overrides stored in
+# recipes/common/packages. Changes to config.yaml affect the targets whose
+# recipe, deployment or cluster configuration changed. Each affected recipe is
+# mapped back through the recipes and deploy fields of config.yaml to the
+# (system, uenv, uarch) jobs that build it.
+#
+# Jobs that resolve to the same recipe and whose targets have the same cluster
+# configuration are built once, and the image is copied to the other jobs
+# ("fanned out"). Set fan-out: true in the uenv's entry in config.yaml to share
+# the image between every system, and between uarch that can run images built
+# for another uarch, e.g. zen3 runs zen2 images. Use --per-target to build
+# every job.
+#
+# usage:
+#   python3 impacted-uenvs.py --since <commit>                    # one "system uenv:version uarch [-> system%uarch ...]" per build
+#   python3 impacted-uenvs.py --since <commit> --format json
+#   python3 impacted-uenvs.py --since <commit> --format gitlab -o jobs.yml
+#
+# If --since is not given, the commit of the last successful pipeline on the
+# current branch is looked up using the GitLab API, which requires
+# UENV_API_TOKEN to be set in the CI/CD variables.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import urllib.request
+
+import yaml
+
+import uenv_recipes
+from uenv_recipes import REPO_ROOT
+
+
+def git(*args):
+    return subprocess.run(
+        ["git", "-C", REPO_ROOT, *args], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def last_successful_commit():
+    try:
+        api = os.environ["CI_API_V4_URL"]
+        project = os.environ["CI_PROJECT_ID"]
+        ref = os.environ["CI_COMMIT_REF_NAME"]
+        token = os.environ["UENV_API_TOKEN"]
+    except KeyError as e:
+        print(f"error: --since was not given, and {e} is not set to look up the last successful pipeline")
+        sys.exit(1)
+    url = f"{api}/projects/{project}/pipelines?status=success&ref={ref}&per_page=1"
+    request = urllib.request.Request(url, headers={"PRIVATE-TOKEN": token})
+    with urllib.request.urlopen(request) as response:
+        pipelines = json.load(response)
+    if not pipelines:
+        print(f"error: no successful pipeline found for {ref}, use --since")
+        sys.exit(1)
+    return pipelines[0]["sha"]
+
+
+def changed_files(since):
+    # --no-renames reports a rename as a deletion and an addition, so both paths are matched
+    output = git("diff", "--name-only", "--no-renames", "-z", since, "HEAD")
+    return [path for path in output.split("\0") if path]
+
+
+def recipe_dependencies(path):
+    """Return the real paths of all files and directories that a recipe is built from."""
+    files = set()
+    dirs = {os.path.realpath(path)}
+    for root, subdirs, names in os.walk(path, followlinks=True):
+        for name in subdirs:
+            full = os.path.join(root, name)
+            dirs.add(os.path.realpath(full))
+            if os.path.islink(full):
+                # the symlink itself is a file tracked by git
+                files.add(os.path.normpath(full))
+        for name in names:
+            full = os.path.join(root, name)
+            files.add(os.path.normpath(full))
+            files.add(os.path.realpath(full))
+    return files, dirs
+
+
+def is_affected(changed, dependencies):
+    files, dirs = dependencies
+    path = os.path.join(REPO_ROOT, changed)
+    # files that were added or removed are matched by the directory that contains them
+    return path in files or os.path.realpath(os.path.dirname(path)) in dirs
+
+
+def config_at(commit):
+    try:
+        return yaml.safe_load(git("show", f"{commit}:config.yaml"))
+    except subprocess.CalledProcessError:
+        return {"clusters": {}, "uenvs": {}}
+
+
+def deployments(config, name, version, uarch):
+    entry = config["uenvs"].get(name, {}).get(version, {})
+    if uarch not in entry.get("recipes", {}):
+        return set()
+    return {system for system, uarchs in entry.get("deploy", {}).items() if uarch in uarchs}
+
+
+def impacted_jobs(since, config):
+    changed = changed_files(since)
+    old_config = config_at(since)
+    old_targets = uenv_recipes.cluster_targets(old_config)
+    new_targets = uenv_recipes.cluster_targets(config)
+
+    jobs = set()
+    dependencies = {}
+    for name, version, uarch, recipe in uenv_recipes.iter_uenvs(config):
+        systems = deployments(config, name, version, uarch)
+        if not systems:
+            continue
+
+        path = uenv_recipes.recipe_path(name, recipe)
+        if path not in dependencies:
+            dependencies[path] = recipe_dependencies(path)
+        if any(is_affected(f, dependencies[path]) for f in changed):
+            jobs.update((system, f"{name}:{version}", uarch) for system in systems)
+            continue
+
+        entry = config["uenvs"][name][version]
+        old_entry = old_config["uenvs"].get(name, {}).get(version, {})
+        if old_entry.get("recipes", {}).get(uarch) != recipe or old_entry.get("mount") != entry.get("mount"):
+            jobs.update((system, f"{name}:{version}", uarch) for system in systems)
+            continue
+
+        # targets that were added to deploy, or whose cluster configuration changed
+        old_systems = deployments(old_config, name, version, uarch)
+        for system in systems:
+            if system not in old_systems or old_targets.get((system, uarch)) != new_targets.get((system, uarch)):
+                jobs.add((system, f"{name}:{version}", uarch))
+
+    return sorted(jobs)
+
+
+def gitlab_pipeline(builds):
+    """Return a child pipeline that triggers one pipeline of this project per build.
+
+    The image of a build is copied to the targets of the build by the fan-out job
+    of the triggered pipeline, which is given the targets in the fanout variable.
+    """
+    if not builds:
+        return {
+            "nothing-to-build": {
+                "tags": ["languard-k8s-lightweight"],
+                "image": "docker.io/python:latest",
+                "script": ["echo 'no uenv are affected by the changes'"],
+            }
+        }
+    pipeline = {}
+    for (system, uenv, uarch), targets in builds:
+        variables = {"system": system, "uenv": uenv, "uarch": uarch}
+        if targets:
+            variables["fanout"] = " ".join(f"{s}%{a}" for s, a in targets)
+        pipeline[f"build-{uenv.replace(':', '-')}-{system}-{uarch}"] = {
+            "variables": variables,
+            "trigger": {
+                "project": "$CI_PROJECT_PATH",
+                "branch": "$CI_COMMIT_REF_NAME",
+                "strategy": "depend",
+            },
+        }
+    return pipeline
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--since", help="Commit of the last successful build")
+parser.add_argument("-c", "--config", default=uenv_recipes.CONFIG_PATH, help="Path of config.yaml")
+parser.add_argument("-f", "--format", choices=["text", "json", "gitlab"], default="text")
+parser.add_argument("-o", "--output", help="Write the output to a file instead of stdout")
+parser.add_argument("--per-target", action="store_true", help="Build every job, instead of sharing images between jobs")
+args = parser.parse_args()
+
+since = args.since or last_successful_commit()
+config = uenv_recipes.load_config(args.config)
+jobs = impacted_jobs(since, config)
+if args.per_target:
+    builds = [(job, []) for job in jobs]
+else:
+    builds = uenv_recipes.shared_builds(jobs, config)
+
+if args.format == "json":
+    output = [
+        {"system": s, "uenv": u, "uarch": a, "fanout": [{"system": ts, "uarch": ta} for ts, ta in targets]}
+        for (s, u, a), targets in builds
+    ]
+    output = json.dumps(output, indent=2) + "\n"
+elif args.format == "gitlab":
+    output = yaml.dump(gitlab_pipeline(builds), default_flow_style=False, sort_keys=False)
+else:
+    output = "".join(
+        f"{s} {u} {a}" + "".join(f" -> {' '.join(f'{ts}%{ta}' for ts, ta in targets)}" if targets else "") + "\n"
+        for (s, u, a), targets in builds
+    )
+
+if args.output:
+    with open(args.output, "w") as f:
+        f.write(output)
+    print(f"{len(jobs)} affected jobs, {len(builds)} builds, written to {args.output}", file=sys.stderr)
+else:
+    sys.stdout.write(output)
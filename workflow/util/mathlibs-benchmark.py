@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+# Measure the math library providers installed in a uenv with the kernels of
+# recipes/common/benchmarks/mathlibs/mathbench.c, and choose the fastest
+# provider of each library for the recipe of the image.
+#
+# usage:
+#   # in an allocation of one node, with the uenv of the recipe mounted
+#   python3 mathlibs-benchmark.py
+#   python3 mathlibs-benchmark.py --kernels dgemm zheevd --size dgemm=8192
+#   python3 mathlibs-benchmark.py --update recipes/cp2k/2026.1/gh200
+#   python3 mathlibs.py recipes/cp2k/2026.1/gh200
+#
+# Each kernel is built against every provider of its library that is installed
+# in the store, from the providers in recipes/common/mathlibs.yaml, and run
+# --repeat times:
+#
+#   dgemm    blas        --launcher, threaded with --threads
+#   zheevd   lapack      --launcher, threaded with --threads
+#   pdsyevd  scalapack   --mpi-launcher, one thread per rank
+#   fft      fftw-api    --launcher, threaded with --threads
+#
+# BLAS and LAPACK are chosen together, as the LAPACK of a provider is linked
+# with its own BLAS, with the lowest product of the dgemm and zheevd times.
+# ScaLAPACK is chosen among the providers that can be linked with them, and the
+# FFT library on its own. With --update, the choice is written to the
+# mathlibs.yaml of a recipe, keeping the spec of a provider that does not change.
+
+import argparse
+import glob
+import os
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+
+import yaml
+
+import uenv_recipes
+
+sys.path.insert(0, os.path.join(uenv_recipes.RECIPES_ROOT, "common", "scripts"))
+import uenv_meta  # noqa: E402
+
+PROVIDERS_PATH = os.path.join(uenv_recipes.RECIPES_ROOT, "common", "mathlibs.yaml")
+SOURCE = os.path.join(uenv_recipes.RECIPES_ROOT, "common", "benchmarks", "mathlibs", "mathbench.c")
+
+KERNELS = {"dgemm": "blas", "zheevd": "lapack", "pdsyevd": "scalapack", "fft": "fftw-api"}
+DEFAULT_SIZES = {"dgemm": 4096, "zheevd": 2048, "pdsyevd": 8192, "fft": 256}
+
+# libraries of each provider, in link order
+LIBRARIES = {
+    "openblas": ["-lopenblas"],
+    "nvpl-blas": ["-lnvpl_blas_lp64_gomp", "-lnvpl_blas_core"],
+    "nvpl-lapack": ["-lnvpl_lapack_lp64_gomp", "-lnvpl_lapack_core"],
+    "netlib-scalapack": ["-lscalapack"],
+    "nvpl-scalapack": ["-lnvpl_scalapack_lp64", "-lnvpl_blacs_lp64_mpich"],
+    "fftw": ["-lfftw3"],
+    "nvpl-fft": ["-lnvpl_fftw"],
+}
+
+# providers that are only linked with the BLAS and LAPACK of the same library
+REQUIRES = {
+    "nvpl-lapack": ["nvpl-blas"],
+    "nvpl-scalapack": ["nvpl-lapack", "nvpl-blas"],
+}
+
+
+def installed(store, providers):
+    """Return {name: prefix} of the providers that are installed once in the store."""
+    uenv_meta.packages(store)
+    prefixes = {}
+    for name in sorted({name for names in providers.values() for name in names}):
+        try:
+            prefixes[name] = uenv_meta.prefix(store, name)
+        except uenv_meta.QueryError as e:
+            if "several" in str(e):
+                print(f"warning: {e}, skipping {name}")
+    return prefixes
+
+
+def compile_flags(name, prefix):
+    """Return the compiler and linker flags of a provider."""
+    flags = []
+    include = os.path.join(prefix, "include")
+    if name == "nvpl-fft":
+        # fftw3.h moved from include/nvpl_fftw to include/nvpl_compat
+        compat = [d for d in ["nvpl_compat", "nvpl_fftw"] if os.path.isdir(os.path.join(include, d))]
+        include = os.path.join(include, compat[0]) if compat else include
+    flags.append(f"-I{include}")
+    libraries = list(LIBRARIES[name])
+    for lib in ["lib", "lib64"]:
+        lib_dir = os.path.join(prefix, lib)
+        if os.path.isdir(lib_dir):
+            flags += [f"-L{lib_dir}", f"-Wl,-rpath,{lib_dir}"]
+            if name == "fftw" and glob.glob(os.path.join(lib_dir, "libfftw3_omp.*")):
+                libraries.insert(0, "-lfftw3_omp")
+    if name == "nvpl-fft" or "-lfftw3_omp" in libraries:
+        flags.append("-DMATHBENCH_FFTW_THREADS")
+    return flags + libraries
+
+
+def measure(kernel, names, prefixes, args, work):
+    """Return the median time of a kernel linked with the providers, or None if it fails to build or run."""
+    executable = os.path.join(work, f"{kernel}-{'-'.join(names)}")
+    command = shlex.split(args.cc) + ["-O2", "-fopenmp", f"-DMATHBENCH_{kernel.upper()}", SOURCE, "-o", executable]
+    for name in names:
+        command += compile_flags(name, prefixes[name])
+    result = subprocess.run(command + ["-lm"], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"  {kernel} {' '.join(names)}: build FAILED\n{result.stderr}")
+        return None
+
+    environment = dict(os.environ, OMP_NUM_THREADS="1" if kernel == "pdsyevd" else str(args.threads))
+    launcher = args.mpi_launcher if kernel == "pdsyevd" else args.launcher
+    command = shlex.split(launcher) + [executable, str(args.size[kernel]), str(args.repeat)]
+    result = subprocess.run(command, capture_output=True, text=True, env=environment)
+    match = re.search(r"time=([0-9.]+)(?: gflops=([0-9.]+))?", result.stdout)
+    if result.returncode != 0 or not match:
+        print(f"  {kernel} {' '.join(names)}: run FAILED\n{result.stderr}")
+        return None
+    rate = f", {match.group(2)} GFlop/s" if match.group(2) else ""
+    print(f"  {kernel} {' '.join(names)}: {float(match.group(1)):.4f} s{rate}")
+    return float(match.group(1))
+
+
+def blas_of(lapack, providers):
+    """Return the BLAS that a LAPACK provider is linked with."""
+    return lapack if lapack in providers["blas"] else REQUIRES[lapack][0]
+
+
+def choose(args, providers, prefixes, work):
+    """Return {virtual: provider} of the fastest providers of the kernels."""
+    candidates = {virtual: [name for name in names if name in prefixes] for virtual, names in providers.items()}
+    chosen = {}
+
+    if "dgemm" in args.kernels or "zheevd" in args.kernels:
+        print("blas and lapack:")
+        dgemm = {}
+        for blas in candidates["blas"] if "dgemm" in args.kernels else []:
+            dgemm[blas] = measure("dgemm", [blas], prefixes, args, work)
+        scores = {}
+        for lapack in candidates["lapack"] if "zheevd" in args.kernels else []:
+            blas = blas_of(lapack, providers)
+            if blas not in prefixes:
+                continue
+            time = measure("zheevd", [lapack] + ([blas] if blas != lapack else []), prefixes, args, work)
+            if time is not None and dgemm.get(blas, 1.0) is not None:
+                scores[(blas, lapack)] = time * dgemm.get(blas, 1.0)
+        if not scores:
+            scores = {(blas, None): time for blas, time in dgemm.items() if time is not None}
+        if scores:
+            blas, lapack = min(scores, key=scores.get)
+            chosen["blas"] = blas
+            if lapack:
+                chosen["lapack"] = lapack
+
+    if "pdsyevd" in args.kernels:
+        print("scalapack:")
+        linked = list(dict.fromkeys(chosen[v] for v in ["lapack", "blas"] if v in chosen))
+        if not linked and candidates["lapack"]:
+            # without the blas and lapack kernels, the first installed pair
+            lapack = candidates["lapack"][0]
+            linked = list(dict.fromkeys([lapack, blas_of(lapack, providers)]))
+        times = {}
+        for scalapack in candidates["scalapack"]:
+            requires = REQUIRES.get(scalapack, [])
+            if any(name not in linked for name in requires):
+                print(f"  pdsyevd {scalapack}: skipped, needs {', '.join(requires)}")
+                continue
+            names = [scalapack] + linked
+            if all(name in prefixes for name in names):
+                times[scalapack] = measure("pdsyevd", names, prefixes, args, work)
+        times = {name: time for name, time in times.items() if time is not None}
+        if times:
+            chosen["scalapack"] = min(times, key=times.get)
+
+    if "fft" in args.kernels:
+        print("fftw-api:")
+        times = {fft: measure("fft", [fft], prefixes, args, work) for fft in candidates["fftw-api"]}
+        times = {name: time for name, time in times.items() if time is not None}
+        if times:
+            chosen["fftw-api"] = min(times, key=times.get)
+    return chosen
+
+
+def update(recipe, chosen):
+    """Write the chosen providers into the mathlibs.yaml of a recipe, for the libraries that it uses."""
+    path = os.path.join(recipe, "mathlibs.yaml")
+    with open(path) as f:
+        lines = f.readlines()
+    result = []
+    for line in lines:
+        match = re.match(r"^([a-z-]+):\s*(.*?)\s*$", line)
+        if match and match.group(1) in chosen:
+            virtual, value = match.groups()
+            name = re.match(r"[a-z0-9_-]+", value).group(0)
+            if name != chosen[virtual]:
+                if value != name:
+                    print(f"note: {path}: the spec '{value}' of {virtual} is replaced by {chosen[virtual]}")
+                line = f"{virtual}: {chosen[virtual]}\n"
+        result.append(line)
+    if result != lines:
+        with open(path, "w") as f:
+            f.writelines(result)
+        print(f"{os.path.relpath(path)}: updated, run mathlibs.py {os.path.relpath(recipe)}")
+    else:
+        print(f"{os.path.relpath(path)}: unchanged")
+
+
+def size(value):
+    kernel, _, n = value.partition("=")
+    if kernel not in KERNELS or not n.isdigit():
+        raise argparse.ArgumentTypeError(f"expected KERNEL=N, with a kernel of {', '.join(KERNELS)}")
+    return kernel, int(n)
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--store", default="/user-environment", help="Mount point of the uenv")
+parser.add_argument("--cc", default="mpicc", help="C compiler, an MPI wrapper for pdsyevd (default: mpicc)")
+parser.add_argument("--kernels", nargs="+", choices=list(KERNELS), default=list(KERNELS), help="Kernels to run (default: all)")
+parser.add_argument("--size", type=size, action="append", default=[], metavar="KERNEL=N", help="Problem size of a kernel")
+parser.add_argument("--repeat", type=int, default=5, help="Runs of each kernel, after a warm up run")
+parser.add_argument("--threads", type=int, default=72, help="OpenMP threads of the threaded kernels (default: 72)")
+parser.add_argument("--launcher", default="srun -n 1 -c 72", help="Launcher of the threaded kernels")
+parser.add_argument("--mpi-launcher", default="srun -n 72 -c 1", help="Launcher of pdsyevd")
+parser.add_argument("--update", metavar="RECIPE", help="Write the chosen providers into the mathlibs.yaml of a recipe")
+args = parser.parse_args()
+args.size = dict(DEFAULT_SIZES, **dict(args.size))
+
+with open(PROVIDERS_PATH) as f:
+    providers = yaml.safe_load(f)
+try:
+    prefixes = installed(args.store, providers)
+except uenv_meta.QueryError as e:
+    print(f"error: {e}")
+    sys.exit(1)
+if not prefixes:
+    print(f"error: no provider of {', '.join(providers)} is installed in {args.store}")
+    sys.exit(1)
+print(f"providers in {args.store}: {', '.join(prefixes)}")
+
+with tempfile.TemporaryDirectory(prefix="mathbench-") as work:
+    chosen = choose(args, providers, prefixes, work)
+
+print("chosen:")
+for virtual in providers:
+    if virtual in chosen:
+        print(f"  {virtual}: {chosen[virtual]}")
+if args.update:
+    update(args.update, chosen)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+
+# Write the math libraries that a recipe selects, BLAS, LAPACK, ScaLAPACK and
+# FFTW, into its specs and providers, and link the shared overrides of the
+# selected packages into the recipe.
+#
+# A recipe selects a provider of each library that it uses in mathlibs.yaml,
+# next to its config.yaml:
+#
+#   blas: nvpl-blas                                        # a provider in recipes/common/mathlibs.yaml
+#   lapack: nvpl-lapack
+#   scalapack: netlib-scalapack ~shared %c,fortran=nvhpc   # or a spec of a provider
+#   fftw-api: fftw +openmp %c,fortran=nvhpc
+#
+# The spec of a provider in recipes/common/mathlibs.yaml is refined by the
+# variants, versions and compiler pins that the recipe adds: a variant or a
+# compiler pin of the recipe replaces the same one of the shared spec, e.g.
+# with "openblas threads=openmp" there, "openblas threads=none" is written as
+# is, and "openblas %c,fortran=gcc" as "openblas threads=openmp %c,fortran=gcc".
+#
+# A recipe marks where they are written with a pair of comments
+#
+#   # begin math libraries
+#   # end math libraries
+#
+# in the specs of an environment in environments.yaml, where the specs are
+# written, and under packages: in packages.yaml, where each library requires
+# its provider, e.g. "blas: require: [nvpl-blas]". The providers are set per
+# library, and not in packages:all:providers, which would replace the providers
+# that the cluster configuration sets for the other libraries. The lines
+# between the comments are replaced on every run. A recipe selects only the
+# libraries that it builds: the provider of each is added to its specs.
+#
+# A selected provider that has a shared override in recipes/common/packages,
+# like nvpl-blas, is linked into the repo/packages of the recipe, and the links
+# to the overrides of providers that are not selected are removed. Recipes that
+# use Spack v1, with spack:packages in config.yaml, name the package directories
+# with underscores, e.g. repo/packages/nvpl_blas, like the overrides in
+# recipes/common/packages, and the other recipes use the package name.
+#
+# usage:
+#   python3 mathlibs.py                                 # update every recipe with a mathlibs.yaml
+#   python3 mathlibs.py recipes/cp2k/2026.1/gh200       # update one recipe
+#   python3 mathlibs.py --check                         # exit 1 if a recipe is out of date
+
+import argparse
+import glob
+import os
+import re
+import sys
+
+import yaml
+
+import uenv_recipes
+
+PROVIDERS_PATH = os.path.join(uenv_recipes.RECIPES_ROOT, "common", "mathlibs.yaml")
+STORE = os.path.join(uenv_recipes.RECIPES_ROOT, "common", "packages")
+
+BEGIN = "# begin math libraries: generated by workflow/util/mathlibs.py, do not edit"
+
+BEGIN_REGEX = re.compile(r"^([ \t]*)# begin math libraries\b.*$")
+END_REGEX = re.compile(r"^[ \t]*# end math libraries\s*$")
+
+
+def read_yaml(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r") as stream:
+        return yaml.safe_load(stream)
+
+
+def package_name(spec):
+    return re.match(r"[a-z0-9_-]+", spec).group(0)
+
+
+def spec_key(token):
+    """Return what a token of a spec sets: a version, a variant, the compilers or a dependency."""
+    if token[0] in "@%^":
+        return token[0] if token[0] != "^" else token
+    if token[0] in "+~":
+        return token[1:]
+    return token.split("=")[0]
+
+
+def merge_spec(shared, value):
+    """Return the spec of a provider in recipes/common/mathlibs.yaml refined by the spec selected by a recipe."""
+    tokens = value.split()[1:]
+    keys = {spec_key(token) for token in tokens}
+    return " ".join(value.split()[:1] + [token for token in shared.split()[1:] if spec_key(token) not in keys] + tokens)
+
+
+def recipe_selection(path, providers):
+    """Return {virtual: (package, spec)} for the selection in a mathlibs.yaml."""
+    selection = {}
+    for virtual, value in read_yaml(path).items():
+        if virtual not in providers:
+            print(f"error: {path}: {virtual} is not one of {', '.join(providers)}")
+            sys.exit(1)
+        name = package_name(value)
+        if name not in providers[virtual]:
+            print(f"error: {path}: {name} is not a provider of {virtual}: {', '.join(providers[virtual])}")
+            sys.exit(1)
+        selection[virtual] = (name, merge_spec(providers[virtual][name], value))
+    return selection
+
+
+def update_file(path, lines, block):
+    """Return the lines of a file with the block written between the markers, and the providers set outside of them."""
+    result = []
+    outside = []
+    inside = False
+    for number, line in enumerate(lines, 1):
+        begin = BEGIN_REGEX.match(line)
+        if begin:
+            if inside:
+                print(f"error: {path}:{number}: math libraries start again before the previous ones end")
+                sys.exit(1)
+            inside = True
+            indent = begin.group(1)
+            result.append(indent + BEGIN + "\n")
+            result += [indent + entry + "\n" for entry in block]
+        elif END_REGEX.match(line):
+            inside = False
+            result.append(line)
+        elif not inside:
+            result.append(line)
+            if OUTSIDE_REGEX.match(line):
+                outside.append(line.strip())
+    if inside:
+        print(f"error: {path}: the generated math libraries do not end")
+        sys.exit(1)
+    return result, outside
+
+
+def package_directory(recipe, name):
+    """Return the name of the directory of a package in the repo of a recipe: with underscores in Spack v1."""
+    config = read_yaml(os.path.join(recipe, "config.yaml"), {})
+    return name.replace("-", "_") if "packages" in config.get("spack", {}) else name
+
+
+def override_links(recipe, selection, providers):
+    """Return {path: target or None} of the links to shared overrides to create or remove."""
+    selected = {name for name, _ in selection.values()}
+    changes = {}
+    for name in sorted({name for names in providers.values() for name in names}):
+        directory = package_directory(recipe, name)
+        path = os.path.join(recipe, "repo", "packages", directory)
+        entries = sorted(glob.glob(os.path.join(STORE, name.replace("-", "_"), "*")))
+        if name in selected and entries and not os.path.lexists(path):
+            if len(entries) > 1:
+                print(f"error: {name} has several shared overrides, link one into {os.path.relpath(recipe)} by hand")
+                sys.exit(1)
+            changes[path] = os.path.relpath(entries[0], os.path.dirname(path))
+        elif name not in selected and os.path.islink(path) and os.path.realpath(path).startswith(STORE + os.sep):
+            changes[path] = None
+    return changes
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("recipe", nargs="*", help="Path of a recipe with a mathlibs.yaml (default: every recipe)")
+parser.add_argument("--check", action="store_true", help="Do not write the recipes, exit 1 if a recipe is out of date")
+args = parser.parse_args()
+
+providers = read_yaml(PROVIDERS_PATH)
+names = sorted({name for names in providers.values() for name in names}, key=len, reverse=True)
+OUTSIDE_REGEX = re.compile(rf"^\s*(- ({'|'.join(map(re.escape, names))})([\s@+~%].*)?|({'|'.join(map(re.escape, providers))}):.*)$")
+
+recipes = args.recipe or sorted(
+    os.path.dirname(path)
+    for path in glob.glob(os.path.join(uenv_recipes.RECIPES_ROOT, "**", "mathlibs.yaml"), recursive=True)
+    if os.path.exists(os.path.join(os.path.dirname(path), "config.yaml"))
+)
+
+stale = []
+for recipe in recipes:
+    selection_path = os.path.join(recipe, "mathlibs.yaml")
+    if not os.path.exists(selection_path):
+        print(f"error: {selection_path} does not exist")
+        sys.exit(1)
+    selection = recipe_selection(selection_path, providers)
+    specs = list(dict.fromkeys(f"- {spec}" for _, spec in selection.values()))
+    blocks = {
+        "environments.yaml": specs,
+        "packages.yaml": [line for virtual, (name, _) in selection.items() for line in (f"{virtual}:", f"  require: [{name}]")],
+    }
+
+    for filename, block in blocks.items():
+        path = os.path.join(recipe, filename)
+        lines = []
+        if os.path.exists(path):
+            with open(path) as f:
+                lines = f.readlines()
+        if not any(BEGIN_REGEX.match(line) for line in lines):
+            print(f"error: {os.path.relpath(path)} has no '# begin math libraries' marker")
+            stale.append(path)
+            continue
+        updated, outside = update_file(path, lines, block)
+        if outside:
+            # a provider written by hand next to the selection would be built, or preferred, as well
+            print(f"error: {os.path.relpath(path)} sets {', '.join(outside)} outside of the math libraries, use mathlibs.yaml")
+            stale.append(path)
+        if updated == lines:
+            continue
+        if args.check:
+            print(f"{os.path.relpath(path)}: out of date, run mathlibs.py {os.path.relpath(recipe)}")
+            stale.append(path)
+            continue
+        yaml.safe_load("".join(updated))
+        with open(path, "w") as f:
+            f.writelines(updated)
+        print(f"{os.path.relpath(path)}: updated")
+
+    for path, target in override_links(recipe, selection, providers).items():
+        if args.check:
+            print(f"{os.path.relpath(path)}: {'missing link' if target else 'unused link'} to a shared override, run mathlibs.py {os.path.relpath(recipe)}")
+            stale.append(path)
+        elif target:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.symlink(target, path)
+            print(f"{os.path.relpath(path)}: linked to {target}")
+        else:
+            os.unlink(path)
+            print(f"{os.path.relpath(path)}: removed")
+
+if stale:
+    sys.exit(1)
@@ -0,0 +1,67 @@
+# the network profiles in recipes/common/network, used by network-profile.py, network-sweep.py and collectives-reference.py
+
+import json
+import os
+import re
+import sys
+
+import yaml
+
+import uenv_recipes
+
+PROFILES_ROOT = os.path.join(uenv_recipes.RECIPES_ROOT, "common", "network")
+
+# nccl-tests: size count type redop root, then time algbw busbw #wrong out-of-place and in-place
+NCCL_ROW_REGEX = re.compile(r"^\s*(\d+)\s+\d+\s+\S+\s+\S+\s+-?\d+\s+([\d.]+)\s+[\d.]+\s+([\d.]+)\s")
+NCCL_AVG_REGEX = re.compile(r"#\s*Avg bus bandwidth\s*:\s*([\d.]+)")
+
+
+def profile_path(name):
+    return os.path.join(PROFILES_ROOT, f"{name}.yaml")
+
+
+def load_profile(name):
+    path = profile_path(name)
+    if not os.path.exists(path):
+        print(f"error: the network profile {path} does not exist")
+        sys.exit(1)
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def write_profile(path, profile, header_from=None):
+    """Write a profile, keeping the comments at the top of the file that it was read from."""
+    header = []
+    if header_from and os.path.exists(header_from):
+        with open(header_from) as f:
+            for line in f:
+                if not line.startswith("#"):
+                    break
+                header.append(line)
+    lines = header + [f"version: {profile['version']}\n", "env:\n"]
+    lines += [f"  {name}: {json.dumps(str(value))}\n" for name, value in profile["env"].items()]
+    collectives = profile.get("collectives")
+    if collectives:
+        lines += [
+            "collectives:\n",
+            "  # fraction by which a measurement may be below the bandwidth, or above the latency, of the reference\n",
+            f"  tolerance: {collectives['tolerance']}\n",
+            "  # per node count: bus bandwidth in GB/s of the largest message, and time in us of the smallest message\n",
+            "  tests:\n",
+        ]
+        for test, nodes in collectives["tests"].items():
+            lines.append(f"    {test}:\n")
+            for count, reference in nodes.items():
+                values = ", ".join(f"{key}: {'null' if value is None else value}" for key, value in reference.items())
+                lines.append(f"      {count}: {{{values}}}\n")
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+
+def parse_nccl(output):
+    """Return (average bus bandwidth in GB/s, rows) of an nccl-tests run, where rows are (size, time in us, busbw)."""
+    avg = NCCL_AVG_REGEX.search(output)
+    rows = [(int(m.group(1)), float(m.group(2)), float(m.group(3))) for m in map(NCCL_ROW_REGEX.match, output.splitlines()) if m]
+    if not avg or not rows:
+        return None
+    return float(avg.group(1)), sorted(rows)
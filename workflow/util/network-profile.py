@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+# Write the NCCL and libfabric settings of a network profile into the recipes
+# that import it, so that every uenv on a system uses the same settings.
+#
+# A recipe imports a profile in network.yaml, next to its config.yaml:
+#
+#   profile: alps-gh200          # recipes/common/network/alps-gh200.yaml
+#   overrides:                   # optional, settings of the recipe that differ from the profile
+#     NCCL_CROSS_NIC: "0"
+#     NCCL_PXN_DISABLE: "1"      # a variable that is not in the profile is added
+#     FI_CXI_RX_MATCH_MODE: null # null removes a variable of the profile
+#
+# and marks where the settings are written, in any of environments.yaml,
+# modules.yaml and the files in extra/, with a pair of comments
+#
+#   # begin network profile
+#   # end network profile
+#
+# at the indentation of the settings, e.g. in the env_vars.set list of a view.
+# The lines between the comments are replaced on every run, and written in the
+# format of the file: a list in environments.yaml, a mapping in other YAML files
+# and pairs in Julia files.
+#
+# The reference performance of the NCCL collectives in the profile is written in
+# the same way between
+#
+#   # begin collectives reference
+#   # end collectives reference
+#
+# in the extras of an environment in extra/reframe.yaml, for the ReFrame tests.
+#
+# usage:
+#   python3 network-profile.py                                   # update every recipe with a network.yaml
+#   python3 network-profile.py recipes/pytorch/v2.9.1/gh200      # update one recipe
+#   python3 network-profile.py --check                           # exit 1 if a recipe is out of date
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+
+import yaml
+
+import netprofile
+import uenv_recipes
+
+BEGIN = "# begin {kind} {name} v{version}: generated by workflow/util/network-profile.py, do not edit"
+
+BEGIN_REGEX = re.compile(r"^([ \t]*)# begin (network profile|collectives reference)\b.*$")
+END_REGEX = re.compile(r"^[ \t]*# end (network profile|collectives reference)\s*$")
+
+
+def read_yaml(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r") as stream:
+        return yaml.safe_load(stream)
+
+
+def recipe_settings(network):
+    """Return the profile, and the settings of a recipe: the profile with the overrides of the recipe."""
+    profile = netprofile.load_profile(network["profile"])
+    settings = {name: str(value) for name, value in profile["env"].items()}
+    for name, value in (network.get("overrides") or {}).items():
+        if value is None:
+            settings.pop(name, None)
+        else:
+            settings[name] = str(value)
+    return profile, settings
+
+
+def format_setting(path, indent, name, value):
+    if path.endswith(".jl"):
+        return f"{indent}{json.dumps(name)} => {json.dumps(value)},\n"
+    if os.path.basename(path) == "environments.yaml":
+        return f"{indent}- {name}: {json.dumps(value)}\n"
+    return f"{indent}{name}: {json.dumps(value)}\n"
+
+
+def format_collectives(indent, collectives):
+    lines = [
+        f"{indent}collectives:\n",
+        f"{indent}  tolerance: {collectives['tolerance']}\n",
+        f"{indent}  # per node count: bus bandwidth in GB/s of the largest message, and time in us of the smallest message\n",
+        f"{indent}  tests:\n",
+    ]
+    for test, nodes in collectives["tests"].items():
+        lines.append(f"{indent}    {test}:\n")
+        for count, reference in nodes.items():
+            values = ", ".join(f"{key}: {'null' if value is None else value}" for key, value in reference.items())
+            lines.append(f"{indent}      {count}: {{{values}}}\n")
+    return lines
+
+
+def marked_files(recipe):
+    candidates = [os.path.join(recipe, name) for name in ["environments.yaml", "modules.yaml"]]
+    candidates += sorted(glob.glob(os.path.join(recipe, "extra", "*")))
+    for path in candidates:
+        if os.path.isfile(path) and not os.path.islink(path):
+            with open(path) as f:
+                lines = f.readlines()
+            if any(BEGIN_REGEX.match(line) for line in lines):
+                yield path, lines
+
+
+def update_file(path, lines, name, profile, settings):
+    """Return the lines of a file with the settings written between the markers, and the settings set outside of them."""
+    result = []
+    outside = set()
+    inside = False
+    for number, line in enumerate(lines, 1):
+        begin = BEGIN_REGEX.match(line)
+        if begin:
+            if inside:
+                print(f"error: {path}:{number}: {begin.group(2)} starts again before the previous one ends")
+                sys.exit(1)
+            inside = True
+            indent, kind = begin.groups()
+            result.append(indent + BEGIN.format(kind=kind, name=name, version=profile["version"]) + "\n")
+            if kind == "network profile":
+                result += [format_setting(path, indent, key, value) for key, value in settings.items()]
+            elif profile.get("collectives"):
+                result += format_collectives(indent, profile["collectives"])
+        elif END_REGEX.match(line):
+            inside = False
+            result.append(line)
+        elif not inside:
+            result.append(line)
+            outside |= {key for key in settings if re.search(rf"(^|[\s\"']){key}[\"']?\s*(:|=>)", line)}
+    if inside:
+        print(f"error: {path}: the generated settings do not end")
+        sys.exit(1)
+    return result, outside
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("recipe", nargs="*", help="Path of a recipe with a network.yaml (default: every recipe)")
+parser.add_argument("--check", action="store_true", help="Do not write the recipes, exit 1 if a recipe is out of date")
+args = parser.parse_args()
+
+recipes = args.recipe or sorted(
+    os.path.dirname(path) for path in glob.glob(os.path.join(uenv_recipes.RECIPES_ROOT, "**", "network.yaml"), recursive=True)
+)
+
+stale = []
+for recipe in recipes:
+    network = read_yaml(os.path.join(recipe, "network.yaml"))
+    if not network:
+        print(f"error: {os.path.join(recipe, 'network.yaml')} does not exist")
+        sys.exit(1)
+    profile, settings = recipe_settings(network)
+    label = f"{network['profile']} v{profile['version']}"
+
+    files = list(marked_files(recipe))
+    if not files:
+        print(f"warning: {os.path.relpath(recipe)} imports {label}, but has no '# begin network profile' marker")
+    for path, lines in files:
+        updated, outside = update_file(path, lines, network["profile"], profile, settings)
+        if outside:
+            # settings written by hand next to the profile are the drift that the profile replaces
+            print(f"error: {os.path.relpath(path)} sets {', '.join(sorted(outside))} outside of the network profile, use overrides in network.yaml")
+            stale.append(path)
+        if updated == lines:
+            continue
+        if args.check:
+            print(f"{os.path.relpath(path)}: out of date with {label}, run network-profile.py {os.path.relpath(recipe)}")
+            stale.append(path)
+            continue
+        if path.endswith(".yaml"):
+            yaml.safe_load("".join(updated))
+        with open(path, "w") as f:
+            f.writelines(updated)
+        print(f"{os.path.relpath(path)}: updated to {label}")
+
+if stale:
+    sys.exit(1)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Measure candidate NCCL and libfabric settings with nccl-tests and the OSU
+# micro-benchmarks, and write the best one as a new version of a network profile.
+#
+# usage:
+#   # in an allocation of two nodes, with a uenv that provides nccl-tests and osu-micro-benchmarks loaded
+#   python3 network-sweep.py --profile alps-gh200 \
+#       --vary FI_CXI_RX_MATCH_MODE=software,hybrid --vary NCCL_NCHANNELS_PER_NET_PEER=2,4,8 \
+#       --output recipes/common/network/alps-gh200.yaml --results sweep.json
+#
+#   # test of the sweep on one node, over the loopback interface with the tcp provider
+#   python3 network-sweep.py --profile alps-gh200 --set NCCL_NET=Socket --set NCCL_SOCKET_IFNAME=lo \
+#       --set FI_PROVIDER=tcp --vary NCCL_NCHANNELS_PER_NET_PEER=1,2 \
+#       --nccl "mpirun -np 2 all_reduce_perf -b 8 -e 16M -f 2 -g 1" --osu "mpirun -np 2 osu_latency"
+#
+# Every combination of the --vary values is run on top of the profile, and of the
+# --set values, which apply to every candidate and are not written to the
+# profile. The profile itself is run first, as the reference.
+#
+# The candidate with the highest average bus bandwidth of the NCCL benchmark
+# wins, among the candidates whose small message latency, measured with the OSU
+# benchmark and as the time of the smallest NCCL message, is within --tolerance
+# of the lowest. If it is not the profile, the profile is written to --output with
+# the settings of the winner and its version increased, and the recipes that
+# import it are updated with network-profile.py.
+
+import argparse
+import itertools
+import json
+import os
+import re
+import shlex
+import statistics
+import subprocess
+import sys
+
+import netprofile
+
+DEFAULT_NCCL = "srun -N 2 --ntasks-per-node 4 --gpus-per-task 1 all_reduce_perf -b 8 -e 1G -f 2 -g 1"
+DEFAULT_OSU = "srun -N 2 --ntasks-per-node 1 osu_latency"
+
+OSU_ROW_REGEX = re.compile(r"^\s*(\d+)\s+([\d.]+)\s*$")
+
+
+def parse_osu(output):
+    """Return the latency in us of the smallest message larger than zero bytes of an osu_latency run."""
+    rows = [(int(m.group(1)), float(m.group(2))) for m in map(OSU_ROW_REGEX.match, output.splitlines()) if m]
+    rows = [row for row in rows if row[0] > 0]
+    return min(rows)[1] if rows else None
+
+
+def run(command, settings, timeout):
+    environment = dict(os.environ, **settings)
+    try:
+        result = subprocess.run(shlex.split(command), env=environment, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def measure(settings, args):
+    """Return the median results of the benchmarks with a set of settings, or None if a run failed."""
+    busbw, nccl_latency, osu_latency = [], [], []
+    for _ in range(args.repeat):
+        output = run(args.nccl, settings, args.timeout)
+        nccl = netprofile.parse_nccl(output) if output is not None else None
+        if nccl is None:
+            return None
+        busbw.append(nccl[0])
+        nccl_latency.append(nccl[1][0][1])
+        if args.osu:
+            output = run(args.osu, settings, args.timeout)
+            osu = parse_osu(output) if output is not None else None
+            if osu is None:
+                return None
+            osu_latency.append(osu)
+    return {
+        "busbw": statistics.median(busbw),
+        "nccl_latency": statistics.median(nccl_latency),
+        "osu_latency": statistics.median(osu_latency) if args.osu else None,
+    }
+
+
+def best(results, tolerance):
+    """Return the index of the candidate with the highest bus bandwidth, among the ones with a low enough latency."""
+    valid = [(i, r) for i, r in enumerate(results) if r["result"] is not None]
+    if not valid:
+        return None
+    limits = {}
+    for key in ["nccl_latency", "osu_latency"]:
+        values = [r["result"][key] for _, r in valid if r["result"][key] is not None]
+        limits[key] = min(values) * (1 + tolerance) if values else None
+    eligible = [(i, r) for i, r in valid if all(limits[k] is None or r["result"][k] <= limits[k] for k in limits)]
+    return max(eligible, key=lambda item: item[1]["result"]["busbw"])[0]
+
+
+def parse_assignment(text, split_values):
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        print(f"error: expected NAME=VALUE, got {text}")
+        sys.exit(1)
+    return name, value.split(",") if split_values else value
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--profile", required=True, help="Name of the profile in recipes/common/network to start from")
+parser.add_argument("--vary", action="append", default=[], help="NAME=VALUE1,VALUE2,... values of a setting to try")
+parser.add_argument("--set", action="append", default=[], help="NAME=VALUE set for every run, and not written to the profile")
+parser.add_argument("--nccl", default=DEFAULT_NCCL, help=f"nccl-tests command (default: {DEFAULT_NCCL})")
+parser.add_argument("--osu", default=DEFAULT_OSU, help=f"OSU latency command, empty to skip (default: {DEFAULT_OSU})")
+parser.add_argument("--repeat", type=int, default=3, help="Runs of each benchmark for every candidate")
+parser.add_argument("--tolerance", type=float, default=0.1, help="Small message latency allowed above the lowest, as a fraction")
+parser.add_argument("--timeout", type=int, default=600, help="Timeout of a benchmark run in seconds")
+parser.add_argument("--output", help="Write the profile with the settings of the best candidate to this file")
+parser.add_argument("--results", help="Write the results of every candidate to a JSON file")
+args = parser.parse_args()
+
+profile = netprofile.load_profile(args.profile)
+base = {name: str(value) for name, value in profile["env"].items()}
+fixed = dict(parse_assignment(text, False) for text in args.set)
+vary = dict(parse_assignment(text, True) for text in args.vary)
+
+candidates = [{}] + ([dict(zip(vary, values)) for values in itertools.product(*vary.values())] if vary else [])
+results = []
+for candidate in candidates:
+    settings = {**base, **candidate, **fixed}
+    label = " ".join(f"{k}={v}" for k, v in candidate.items()) or f"{args.profile} v{profile['version']}"
+    result = measure(settings, args)
+    results.append({"candidate": candidate, "result": result})
+    if result is None:
+        print(f"{label}: FAILED")
+        continue
+    osu = f", osu latency {result['osu_latency']:.2f} us" if result["osu_latency"] is not None else ""
+    print(f"{label}: busbw {result['busbw']:.2f} GB/s, nccl latency {result['nccl_latency']:.2f} us{osu}")
+
+if args.results:
+    with open(args.results, "w") as f:
+        json.dump({"profile": args.profile, "version": profile["version"], "set": fixed, "candidates": results}, f, indent=2)
+
+winner = best(results, args.tolerance)
+if winner is None:
+    print("error: every candidate failed")
+    sys.exit(1)
+env = dict(base, **results[winner]["candidate"])
+if env == base:
+    print(f"{args.profile} v{profile['version']} is the best candidate, the profile is unchanged")
+    sys.exit(0)
+print("best candidate: " + " ".join(f"{k}={v}" for k, v in results[winner]["candidate"].items()))
+if args.output:
+    netprofile.write_profile(args.output, dict(profile, version=profile["version"] + 1, env=env), netprofile.profile_path(args.profile))
+    print(f"wrote {args.profile} v{profile['version'] + 1} to {args.output}, update the recipes with network-profile.py")
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+
+# Inspect and tune the layout of the squashfs image of a uenv.
+#
+# usage:
+#   # bytes per view and per package, of a store directory or of an image
+#   python3 squashfs-layout.py report $BUILD/store
+#   python3 squashfs-layout.py report store.squashfs -o layout.json
+#
+#   # compare compressors and block sizes: image size, cold read of the hot files, random access
+#   python3 squashfs-layout.py bench $BUILD/store -o bench.json
+#   python3 squashfs-layout.py bench $BUILD/store --candidate zstd:3:128K --candidate xz:0:1M
+#
+#   # write the mksquashfs sort file that packs the hot files together
+#   python3 squashfs-layout.py sort $BUILD/store -o hot.sort
+#
+#   # create the image with the settings of the recipe, recorded in meta/squashfs.json
+#   python3 squashfs-layout.py pack $BUILD/store -o $BUILD/store.squashfs
+#
+# The settings of a recipe are read from extra/squashfs.yaml in the copy of the
+# recipe in the store's meta directory, and default to the settings that
+# stackinator uses (zstd level 3, 128K blocks):
+#
+#   compression: zstd       # zstd, xz, lz4 or gzip
+#   level: 3                # compression level of zstd and gzip
+#   block-size: 128K
+#   hot:                    # glob patterns of additional hot files, relative to the store
+#   - "linux-*/*/py-torch-*/lib/python3*/site-packages/torch/lib/*.so*"
+#
+# Hot files are the files read by nearly every job that uses the uenv: the
+# Python standard library, libtorch, the CUDA libraries, and the libraries that
+# are visible to ld.so through the lib and lib64 directories of the views.
+#
+# bench reads files from the candidate images with unsquashfs, after dropping
+# the image from the page cache, so the timings include the startup of
+# unsquashfs and are only meaningful relative to each other. Run it on the file
+# system that the images are deployed on to include its read amplification.
+
+import argparse
+import fnmatch
+import json
+import os
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import yaml
+
+DEFAULT_SETTINGS = {"compression": "zstd", "level": 3, "block-size": "128K", "hot": []}
+
+DEFAULT_CANDIDATES = [
+    "zstd:1:128K",
+    "zstd:3:128K",
+    "zstd:9:128K",
+    "zstd:19:128K",
+    "zstd:3:1M",
+    "xz:0:1M",
+    "lz4:0:128K",
+]
+
+# mksquashfs sort priorities of the hot files, higher priorities are placed first
+HOT_PATTERNS = [
+    (100, ["*/libtorch*.so*", "*/libc10*.so*"]),
+    (90, ["*/libcuda*.so*", "*/libcudart*.so*", "*/libcublas*.so*", "*/libnccl*.so*"]),
+]
+PYTHON_STDLIB_PRIORITY = 80
+RECIPE_PRIORITY = 70
+VIEW_LIBRARY_PRIORITY = 50
+
+# modules of the Python standard library
+PYTHON_STDLIB_REGEX = re.compile(r"/lib/python3\.\d+/(?!test/)(?:[^/]+\.py|lib-dynload/[^/]+\.so|[^/]+/[^/]+\.py)$")
+
+# name-version-hash of a Spack install prefix
+PREFIX_REGEX = re.compile(r"^(.+)-([a-z0-9]{32})$")
+
+# a file in the output of unsquashfs -lls: permissions, owner, size, date, time, path
+LISTING_REGEX = re.compile(r"^([-dlcbps])[rwxsStT-]{9}\s+\S+\s+(\d+)\s+\S+\s+\S+\s+squashfs-root(/.*)?$")
+
+
+def list_directory(root):
+    """Return {path: (kind, size, link target)} for the entries of a directory, with paths relative to root."""
+    entries = {"": ("d", 0, None)}
+    for dirpath, dirs, files in os.walk(root):
+        for name in dirs + files:
+            full = os.path.join(dirpath, name)
+            path = os.path.relpath(full, root)
+            if os.path.islink(full):
+                entries[path] = ("l", 0, os.readlink(full))
+            elif os.path.isdir(full):
+                entries[path] = ("d", 0, None)
+            else:
+                entries[path] = ("-", os.lstat(full).st_size, None)
+    return entries
+
+
+def list_image(image):
+    """Return the entries of a squashfs image, in the format of list_directory."""
+    output = subprocess.run(["unsquashfs", "-lls", image], check=True, capture_output=True, text=True).stdout
+    entries = {}
+    for line in output.splitlines():
+        match = LISTING_REGEX.match(line)
+        if not match:
+            continue
+        kind, size, path = match.group(1), int(match.group(2)), (match.group(3) or "/")[1:]
+        target = None
+        if kind == "l":
+            path, target = path.split(" -> ", 1)
+            size = 0
+        entries[path] = (kind, size if kind == "-" else 0, target)
+    return entries
+
+
+def resolve(entries, path, mount, depth=0):
+    """Follow the symlinks of a path in the store, return None if it leaves the store."""
+    parts = path.split("/") if path else []
+    resolved = ""
+    for part in parts:
+        resolved = os.path.normpath(os.path.join(resolved, part)) if resolved else part
+        entry = entries.get(resolved)
+        if entry is None or depth > 40:
+            return None
+        if entry[0] == "l":
+            target = entry[2]
+            if os.path.isabs(target):
+                if os.path.commonpath([target, mount]) != mount:
+                    return None
+                target = os.path.relpath(target, mount)
+            else:
+                target = os.path.normpath(os.path.join(os.path.dirname(resolved), target))
+            if target.startswith(".."):
+                return None
+            resolved = resolve(entries, target if target != "." else "", mount, depth + 1)
+            if resolved is None:
+                return None
+    return resolved
+
+
+def package_prefixes(entries):
+    """Return {prefix: name-version} for the Spack install prefixes in the store."""
+    prefixes = {}
+    for path in entries:
+        if os.path.basename(path) == "spec.json" and os.path.basename(os.path.dirname(path)) == ".spack":
+            prefix = os.path.dirname(os.path.dirname(path))
+            match = PREFIX_REGEX.match(os.path.basename(prefix))
+            prefixes[prefix] = match.group(1) if match else os.path.basename(prefix)
+    return prefixes
+
+
+def owner(path, prefixes):
+    """Return the install prefix that contains a path, or None."""
+    while path:
+        if path in prefixes:
+            return path
+        path = os.path.dirname(path)
+    return None
+
+
+def views(entries):
+    """Return the paths of the views in the store: the entries of env/ that are not hidden."""
+    return sorted(
+        path for path in entries if os.path.dirname(path) == "env" and not os.path.basename(path).startswith(".")
+    )
+
+
+def view_files(entries, view, mount):
+    """Return the set of regular files that are reachable from a view, after following symlinks."""
+    root = resolve(entries, view, mount)
+    if root is None:
+        return set()
+    files = set()
+    for path, (kind, _, _) in entries.items():
+        if path.startswith(root + "/") and kind in ("-", "l"):
+            target = resolve(entries, path, mount) if kind == "l" else path
+            if target and entries.get(target, ("d",))[0] == "-":
+                files.add(target)
+    return files
+
+
+def read_entries(source):
+    return list_directory(source) if os.path.isdir(source) else list_image(source)
+
+
+def cmd_report(args):
+    entries = read_entries(args.source)
+    prefixes = package_prefixes(entries)
+
+    packages = {prefix: 0 for prefix in prefixes}
+    other = 0
+    for path, (kind, size, _) in entries.items():
+        if kind == "-":
+            prefix = owner(path, prefixes)
+            if prefix:
+                packages[prefix] += size
+            else:
+                other += size
+    total = sum(packages.values()) + other
+
+    view_sizes = {}
+    for view in views(entries):
+        files = view_files(entries, view, args.mount)
+        view_sizes[os.path.basename(view)] = {
+            "bytes": sum(entries[f][1] for f in files),
+            "packages": len({owner(f, prefixes) for f in files} - {None}),
+        }
+
+    print(f"{'view':40s} {'size':>10s} {'packages':>8s}")
+    for name, view in sorted(view_sizes.items()):
+        print(f"{name:40s} {human(view['bytes']):>10s} {view['packages']:8d}")
+    print()
+    print(f"{'package':60s} {'size':>10s} {'share':>6s}")
+    ranked = sorted(packages.items(), key=lambda item: -item[1])
+    for prefix, size in ranked[: args.top]:
+        print(f"{prefixes[prefix]:60s} {human(size):>10s} {100 * size / max(total, 1):5.1f}%")
+    print(f"{'files outside of packages':60s} {human(other):>10s} {100 * other / max(total, 1):5.1f}%")
+    print(f"{'total':60s} {human(total):>10s}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "total": total,
+                    "other": other,
+                    "views": view_sizes,
+                    "packages": {prefixes[p]: {"prefix": p, "bytes": s} for p, s in ranked},
+                },
+                f,
+                indent=2,
+            )
+
+
+def human(size):
+    for unit in ["B", "K", "M", "G"]:
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
+
+
+def load_settings(source, path=None):
+    """Return the squashfs settings of the recipe in the store's meta directory, or of path."""
+    path = path or os.path.join(source, "meta", "recipe", "extra", "squashfs.yaml")
+    settings = dict(DEFAULT_SETTINGS)
+    if os.path.exists(path):
+        with open(path) as f:
+            settings.update(yaml.safe_load(f) or {})
+    return settings
+
+
+def hot_files(entries, settings, mount):
+    """Return {path: priority} of the hot files in the store."""
+    patterns = list(HOT_PATTERNS) + [(RECIPE_PRIORITY, settings.get("hot") or [])]
+    hot = {}
+    for path, (kind, _, _) in entries.items():
+        if kind != "-":
+            continue
+        priority = max((p for p, globs in patterns if any(fnmatch.fnmatch(path, g) for g in globs)), default=0)
+        if PYTHON_STDLIB_REGEX.search(path) and "/site-packages/" not in path:
+            priority = max(priority, PYTHON_STDLIB_PRIORITY)
+        if priority:
+            hot[path] = priority
+
+    # libraries found by ld.so through the LD_LIBRARY_PATH set by the views
+    libdirs = set()
+    for view in views(entries):
+        root = resolve(entries, view, mount)
+        if root is not None:
+            libdirs.update(f"{root}/{libdir}" for libdir in ["lib", "lib64"])
+    for path, (kind, _, _) in entries.items():
+        if os.path.dirname(path) in libdirs and ".so" in os.path.basename(path):
+            target = resolve(entries, path, mount)
+            if target and entries[target][0] == "-":
+                hot[target] = max(VIEW_LIBRARY_PRIORITY, hot.get(target, 0))
+    return hot
+
+
+def write_sort_file(path, hot):
+    with open(path, "w") as f:
+        for file, priority in sorted(hot.items(), key=lambda item: (-item[1], item[0])):
+            f.write(f"{file} {priority}\n")
+
+
+def cmd_sort(args):
+    entries = list_directory(args.source)
+    hot = hot_files(entries, load_settings(args.source, args.settings), args.mount)
+    write_sort_file(args.output, hot)
+    size = sum(entries[f][1] for f in hot)
+    print(f"{len(hot)} hot files ({human(size)}) written to {args.output}")
+
+
+def mksquashfs_args(settings):
+    args = ["-comp", settings["compression"], "-b", str(settings["block-size"])]
+    # xz and lz4 have no compression level
+    if settings["compression"] in ("zstd", "gzip") and settings.get("level"):
+        args += ["-Xcompression-level", str(settings["level"])]
+    return args
+
+
+def mksquashfs(source, image, settings, sort_file=None):
+    command = ["mksquashfs", source, image, *mksquashfs_args(settings)]
+    command += ["-force-uid", "nobody", "-force-gid", "nobody", "-all-time", str(int(time.time()))]
+    command += ["-no-recovery", "-noappend", "-quiet", "-no-progress"]
+    if sort_file:
+        command += ["-sort", sort_file]
+    start = time.time()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.time() - start
+
+
+def drop_cache(image):
+    fd = os.open(image, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def read_file(image, path):
+    start = time.time()
+    subprocess.run(["unsquashfs", "-cat", image, path], check=True, stdout=subprocess.DEVNULL)
+    return time.time() - start
+
+
+def parse_candidate(candidate):
+    compression, level, block_size = candidate.split(":")
+    return {"compression": compression, "level": int(level), "block-size": block_size}
+
+
+def cmd_bench(args):
+    if not shutil.which("mksquashfs") or not shutil.which("unsquashfs"):
+        print("error: mksquashfs and unsquashfs are required")
+        sys.exit(1)
+    entries = list_directory(args.source)
+    settings = load_settings(args.source, args.settings)
+    hot = hot_files(entries, settings, args.mount)
+    files = [path for path, (kind, size, _) in entries.items() if kind == "-" and size > 0]
+    sample = random.Random(0).sample(files, min(args.samples, len(files)))
+    uncompressed = sum(size for kind, size, _ in entries.values() if kind == "-")
+
+    workdir = tempfile.mkdtemp(dir=args.workdir)
+    sort_file = os.path.join(workdir, "hot.sort")
+    write_sort_file(sort_file, hot)
+    results = []
+    try:
+        for candidate in args.candidate or DEFAULT_CANDIDATES:
+            candidate_settings = parse_candidate(candidate)
+            image = os.path.join(workdir, "candidate.squashfs")
+            seconds = mksquashfs(args.source, image, candidate_settings, sort_file)
+            size = os.path.getsize(image)
+
+            # the hot files are read in one go after a cold start, the samples each from a cold cache
+            drop_cache(image)
+            cold = sum(read_file(image, path) for path in sorted(hot, key=hot.get, reverse=True)[: args.samples])
+            random_access = []
+            for path in sample:
+                drop_cache(image)
+                random_access.append(read_file(image, path))
+            result = {
+                "candidate": candidate,
+                "bytes": size,
+                "ratio": round(uncompressed / max(size, 1), 2),
+                "mksquashfs_seconds": round(seconds, 1),
+                "cold_hot_read_seconds": round(cold, 3),
+                "random_access_median_ms": round(1000 * statistics.median(random_access), 1) if random_access else None,
+            }
+            results.append(result)
+            print(
+                f"{candidate:14s} {human(size):>10s} x{result['ratio']:<6} mksquashfs {result['mksquashfs_seconds']:7.1f}s"
+                f"  hot {result['cold_hot_read_seconds']:7.3f}s  random {result['random_access_median_ms']}ms"
+            )
+            os.remove(image)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"uncompressed": uncompressed, "hot_files": len(hot), "results": results}, f, indent=2)
+
+
+def cmd_pack(args):
+    entries = list_directory(args.source)
+    settings = load_settings(args.source, args.settings)
+    hot = hot_files(entries, settings, args.mount)
+    workdir = tempfile.mkdtemp()
+    sort_file = os.path.join(workdir, "hot.sort")
+    write_sort_file(sort_file, hot)
+
+    version = subprocess.run(["mksquashfs", "-version"], capture_output=True, text=True).stdout.splitlines()
+    record = {
+        "compression": settings["compression"],
+        "level": settings["level"],
+        "block-size": str(settings["block-size"]),
+        "hot_files": len(hot),
+        "hot_bytes": sum(entries[f][1] for f in hot),
+        "mksquashfs": version[0] if version else None,
+    }
+    os.makedirs(os.path.join(args.source, "meta"), exist_ok=True)
+    with open(os.path.join(args.source, "meta", "squashfs.json"), "w") as f:
+        json.dump(record, f, indent=2)
+    try:
+        seconds = mksquashfs(args.source, args.output, settings, sort_file)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(
+        f"{args.output}: {human(os.path.getsize(args.output))} with {settings['compression']} level {settings['level']}, "
+        f"{settings['block-size']} blocks, {len(hot)} hot files first, in {seconds:.0f}s"
+    )
+
+
+parser = argparse.ArgumentParser()
+subparsers = parser.add_subparsers(dest="command", required=True)
+
+report = subparsers.add_parser("report", help="Print the bytes of each view and package")
+report.add_argument("source", help="Store directory or squashfs image")
+report.add_argument("--top", type=int, default=30, help="Number of packages to print")
+report.add_argument("-o", "--output", help="Also write the report to a json file")
+
+bench = subparsers.add_parser("bench", help="Compare compressors and block sizes")
+bench.add_argument("source", help="Store directory")
+bench.add_argument("--candidate", action="append", help="compression:level:block-size, e.g. zstd:3:128K (default: a set of candidates)")
+bench.add_argument("--samples", type=int, default=200, help="Number of files read for the cold and random access timings")
+bench.add_argument("--workdir", default=os.environ.get("TMPDIR"), help="Directory for the candidate images")
+bench.add_argument("-o", "--output", help="Also write the results to a json file")
+
+sort = subparsers.add_parser("sort", help="Write the mksquashfs sort file of the hot files")
+sort.add_argument("source", help="Store directory")
+sort.add_argument("-o", "--output", required=True)
+
+pack = subparsers.add_parser("pack", help="Create the image with the settings of the recipe")
+pack.add_argument("source", help="Store directory")
+pack.add_argument("-o", "--output", required=True, help="Path of the image")
+
+for subparser in [report, bench, sort, pack]:
+    subparser.add_argument("--mount", default="/user-environment", help="Mount point of the uenv")
+for subparser in [bench, sort, pack]:
+    subparser.add_argument("--settings", help="squashfs.yaml to use instead of the one in the recipe")
+
+args = parser.parse_args()
+{
+    "report": cmd_report,
+    "bench": cmd_bench,
+    "sort": cmd_sort,
+    "pack": cmd_pack,
+}[args.command](args)
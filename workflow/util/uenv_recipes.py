@@ -0,0 +1,222 @@
+# helpers shared by the scripts in workflow/util for walking config.yaml and the recipes tree
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+
+import yaml
+
+# the root of the alps-uenv repository
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+RECIPES_ROOT = os.path.join(REPO_ROOT, "recipes")
+CONFIG_PATH = os.path.join(REPO_ROOT, "config.yaml")
+
+# the Spack target used for each uarch
+UARCH_TARGETS = {
+    "a100": "zen3",
+    "gh200": "neoverse_v2",
+    "mi200": "zen3",
+    "mi300": "zen4",
+    "zen2": "zen2",
+    "zen3": "zen3",
+}
+
+# uarch that can run images built for other uarch: a uenv with fan-out: true in
+# config.yaml is built once for these uarch, for the uarch listed here, see shared_builds
+UARCH_COMPATIBLE = {
+    "zen3": ["zen2"],
+}
+
+# the results of concretize-recipe.py, see concretization_entry
+CONCRETIZE_CACHE = os.environ.get("UENV_CONCRETIZE_CACHE", os.path.expanduser("~/.cache/uenv-concretize"))
+
+# local git mirrors of spack.git and spack-packages.git, see concretize-recipe.py
+GIT_MIRROR = os.environ.get("UENV_GIT_MIRROR")
+
+# change when the way concretize-recipe.py generates environments changes, to invalidate the cache
+CONCRETIZE_CACHE_VERSION = "2"
+
+# number of hex digits of the sha256 used to name shared overrides in recipes/common/packages
+HASH_LENGTH = 16
+
+
+def load_config(path=CONFIG_PATH):
+    with open(path, "r") as stream:
+        return yaml.safe_load(stream)
+
+
+def recipe_path(name, recipe, recipes_root=RECIPES_ROOT):
+    """Return the path of the recipe used for uenv `name`.
+
+    The recipe in config.yaml is relative to recipes/<name>, falling back to
+    recipes/ for uenv that live under a different directory (e.g. icon-wcp).
+    """
+    path = os.path.join(recipes_root, name, recipe)
+    if os.path.isdir(path):
+        return os.path.normpath(path)
+    return os.path.normpath(os.path.join(recipes_root, recipe))
+
+
+def uenv_recipe_path(uenv, uarch, config=None):
+    """Return the path of the recipe used to build uenv name:version for uarch."""
+    config = config or load_config()
+    name, version = uenv.split(":")
+    return recipe_path(name, str(config["uenvs"][name][version]["recipes"][uarch]))
+
+
+def iter_uenvs(config):
+    """Yield (name, version, uarch, recipe) for every recipe entry in config.yaml."""
+    for name, versions in config["uenvs"].items():
+        for version, entry in versions.items():
+            for uarch, recipe in entry.get("recipes", {}).items():
+                yield name, str(version), uarch, str(recipe)
+
+
+def hash_tree(path):
+    """Return the sha256 of a directory, over the relative paths and contents of its files.
+
+    Symlinks are followed, so an override stored in common/packages hashes the
+    same as a byte-identical copy in a recipe.
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path, followlinks=True):
+        dirs.sort()
+        if "__pycache__" in dirs:
+            dirs.remove("__pycache__")
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            digest.update(os.path.relpath(full, path).encode() + b"\0")
+            with open(full, "rb") as f:
+                digest.update(f.read())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def package_overrides(recipes_root=RECIPES_ROOT):
+    """Yield the path of every repo/packages/<name> override directory in the recipes tree.
+
+    Paths that are symlinks (to another recipe's repo, or into common/packages)
+    are yielded as they appear in the tree, and are not descended into.
+    """
+    for root, dirs, files in os.walk(recipes_root):
+        dirs.sort()
+        if root == os.path.join(recipes_root, "common") and "packages" in dirs:
+            dirs.remove("packages")
+        if os.path.basename(root) == "packages" and os.path.basename(os.path.dirname(root)) == "repo":
+            # os.walk lists symlinks to directories alongside the real directories
+            for name in dirs:
+                yield os.path.join(root, name)
+            dirs[:] = []
+
+
+_resolved_refs = {}
+
+
+def git_source(url, mirror=None):
+    """Return the repository to clone url from: <mirror>/<name> if a mirror is given."""
+    return os.path.join(mirror, os.path.basename(url.rstrip("/"))) if mirror else url
+
+
+def resolve_ref(url, ref, mirror=None):
+    """Return the commit of a branch or tag of a git repository, or ref if it is already a commit.
+
+    The commit: of config.yaml is often a branch like releases/v1.1, which moves,
+    so it is resolved with git ls-remote, once per process.
+    """
+    if re.fullmatch(r"[0-9a-f]{7,40}", ref):
+        return ref
+    source = git_source(url, mirror)
+    if (source, ref) not in _resolved_refs:
+        result = subprocess.run(["git", "ls-remote", source, ref, f"{ref}^{{}}"], capture_output=True, text=True)
+        refs = dict(reversed(line.split()) for line in result.stdout.splitlines() if line.strip())
+        # the commit of an annotated tag is the peeled ref, <tag>^{}
+        matches = [refs[name] for name in refs if name.endswith(f"/{ref}^{{}}")]
+        matches += [refs[name] for name in refs if name.endswith(f"/{ref}")]
+        if result.returncode != 0 or not matches:
+            raise RuntimeError(f"unable to resolve {ref} in {source}: {result.stderr.strip() or 'no such ref'}")
+        _resolved_refs[(source, ref)] = matches[0]
+    return _resolved_refs[(source, ref)]
+
+
+def recipe_hash(recipe, target=None, extra_repos=[], mirror=GIT_MIRROR):
+    """Return the key of a recipe in the concretization cache.
+
+    The key covers everything that changes the result of concretization: the
+    pinned Spack commits, resolved from branches and tags, environments.yaml,
+    compilers.yaml, packages.yaml and the package repositories.
+    """
+    with open(os.path.join(recipe, "config.yaml"), "r") as stream:
+        spack = yaml.safe_load(stream)["spack"]
+    digest = hashlib.sha256()
+    digest.update(f"cache-version {CONCRETIZE_CACHE_VERSION}\n".encode())
+    digest.update(f"target {target}\n".encode())
+    digest.update(f"spack {spack['repo']} {resolve_ref(spack['repo'], spack['commit'], mirror)}\n".encode())
+    if "packages" in spack:
+        packages = spack["packages"]
+        digest.update(f"packages {packages['repo']} {resolve_ref(packages['repo'], packages['commit'], mirror)}\n".encode())
+    for name in ["environments.yaml", "compilers.yaml", "packages.yaml"]:
+        path = os.path.join(recipe, name)
+        if os.path.exists(path):
+            digest.update(name.encode() + b"\0")
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    for path in [os.path.join(recipe, "repo")] + list(extra_repos):
+        if os.path.isdir(path):
+            digest.update(hash_tree(path).encode())
+    return digest.hexdigest()
+
+
+def concretization_entry(cache, key):
+    """Return the path where concretize-recipe.py stores result.json and the environments of a recipe."""
+    return os.path.join(cache, key[:2], key)
+
+
+def cluster_targets(config):
+    """Return {(system, uarch): target} for every target in the clusters field."""
+    targets = {}
+    for system, cluster in config.get("clusters", {}).items():
+        for target in cluster.get("targets", []):
+            targets[(system, target["uarch"])] = dict(target, runner=cluster.get("runner"))
+    return targets
+
+
+def shared_builds(jobs, config):
+    """Group (system, uenv, uarch) build jobs that can use the same image.
+
+    Jobs of a uenv whose uarch resolve to the same recipe are built once, and
+    the image is copied to the other jobs, only if the cluster configuration of
+    their targets in config.yaml is the same: the environments and packages.yaml
+    of a system can differ from those of another. A uenv version with
+    `fan-out: true` in config.yaml declares that its image does not depend on
+    the system, and is built once for every system and compatible uarch, for the
+    most basic uarch of the group.
+
+    Return a list of (build, targets), where build is a job and targets are the
+    (system, uarch) that its image is copied to.
+    """
+    targets = cluster_targets(config)
+    groups = {}
+    for system, uenv, uarch in jobs:
+        name, version = uenv.split(":")
+        entry = config["uenvs"][name][version]
+        recipe = os.path.realpath(recipe_path(name, str(entry["recipes"][uarch])))
+        if entry.get("fan-out"):
+            key = (uenv, recipe, None)
+        else:
+            key = (uenv, recipe, uarch, json.dumps(targets.get((system, uarch)), sort_keys=True))
+        groups.setdefault(key, []).append((system, uenv, uarch))
+
+    builds = []
+    for group in groups.values():
+        uarchs = {uarch for _, _, uarch in group}
+        by_base = {}
+        for job in sorted(group):
+            candidates = [u for u in uarchs if u == job[2] or u in UARCH_COMPATIBLE.get(job[2], [])]
+            base = min(candidates, key=lambda u: (len(UARCH_COMPATIBLE.get(u, [])), u))
+            by_base.setdefault(base, []).append(job)
+        for base, members in sorted(by_base.items()):
+            build = next(job for job in members if job[2] == base)
+            builds.append((build, [(job[0], job[2]) for job in members if job != build]))
+    return sorted(builds)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# Run the VASP benchmark inputs of a recipe, and compare the elapsed time and
+# memory with the reference of the system, or between builds of VASP with
+# different performance variants.
+#
+# usage:
+#   # in an allocation of one node, with the vasp view of the uenv loaded
+#   python3 vasp-benchmark.py --system zen2 --potcars $HOME/potpaw_PBE --launcher "srun -n 128 -c 1"
+#   python3 vasp-benchmark.py --system zen2 --potcars $HOME/potpaw_PBE --cases si127-hse \
+#       --vasp shmem=/user-environment/env/vasp/bin --vasp noshmem=$HOME/vasp-noshmem/bin
+#
+# The inputs are read from /user-environment/meta/extra/benchmarks, or --inputs,
+# the extra/benchmarks of the recipe. benchmarks.yaml lists the cases, with the
+# executable, the variants that the case exercises and the reference of each
+# system. The POTCAR of a case is the concatenation of <potcars>/<element>/POTCAR
+# for the elements of its POSCAR.
+#
+# Every case runs --repeat times with every build, by default the executables
+# in PATH, and the median elapsed time and maximum memory per rank are read
+# from the OUTCAR. A time or memory higher than the reference by more than the
+# tolerance is a regression, and the script exits 1. With several builds, each
+# build is also compared with the first one.
+
+import argparse
+import os
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import yaml
+
+DEFAULT_INPUTS = "/user-environment/meta/extra/benchmarks"
+DEFAULT_LAUNCHER = "srun"
+
+
+def potcar(case_dir, potcars, output):
+    with open(os.path.join(case_dir, "POSCAR")) as f:
+        elements = f.readlines()[5].split()
+    with open(output, "w") as out:
+        for element in elements:
+            with open(os.path.join(potcars, element, "POTCAR")) as f:
+                out.write(f.read())
+
+
+def parse_outcar(path):
+    """Return the elapsed time in seconds and the maximum memory per rank in MB of a run, or None."""
+    time = memory = None
+    with open(path) as f:
+        for line in f:
+            if "Elapsed time (sec):" in line:
+                time = float(line.split(":")[1])
+            elif "Maximum memory used (kb):" in line:
+                memory = float(line.split(":")[1]) / 1024
+    if time is None or memory is None:
+        return None
+    return time, memory
+
+
+def run(case, executable, args):
+    """Return the median elapsed time and maximum memory of a case, or None if a run fails."""
+    case_dir = os.path.join(args.inputs, case)
+    times, memories = [], []
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory(prefix=f"vasp-{case}-") as work:
+            for name in ["INCAR", "POSCAR", "KPOINTS"]:
+                shutil.copy(os.path.join(case_dir, name), work)
+            potcar(case_dir, args.potcars, os.path.join(work, "POTCAR"))
+            command = shlex.split(args.launcher) + [executable]
+            result = subprocess.run(command, cwd=work, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            outcar = os.path.join(work, "OUTCAR")
+            parsed = parse_outcar(outcar) if result.returncode == 0 and os.path.exists(outcar) else None
+        if parsed is None:
+            return None
+        times.append(parsed[0])
+        memories.append(parsed[1])
+    return statistics.median(times), statistics.median(memories)
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--system", required=True, help="System of the reference in benchmarks.yaml, e.g. zen2 or gh200")
+parser.add_argument("--potcars", required=True, help="Directory of the PAW datasets, with <element>/POTCAR")
+parser.add_argument("--inputs", default=DEFAULT_INPUTS, help=f"Directory of benchmarks.yaml (default: {DEFAULT_INPUTS})")
+parser.add_argument("--cases", nargs="+", help="Cases to run (default: all)")
+parser.add_argument(
+    "--vasp",
+    action="append",
+    metavar="LABEL=BIN",
+    help="A build to run, the bin directory of its executables (default: the executables in PATH)",
+)
+parser.add_argument("--launcher", default=DEFAULT_LAUNCHER, help=f"Launcher of VASP (default: {DEFAULT_LAUNCHER})")
+parser.add_argument("--repeat", type=int, default=1, help="Runs of each case")
+args = parser.parse_args()
+
+with open(os.path.join(args.inputs, "benchmarks.yaml")) as f:
+    benchmarks = yaml.safe_load(f)
+tolerance = benchmarks["tolerance"]
+builds = [build.split("=", 1) for build in args.vasp] if args.vasp else [["PATH", None]]
+for case in args.cases or []:
+    if case not in benchmarks["cases"]:
+        print(f"error: {case} is not a case of {args.inputs}, available: {', '.join(benchmarks['cases'])}")
+        sys.exit(1)
+
+failed = []
+for case, config in benchmarks["cases"].items():
+    if args.cases and case not in args.cases:
+        continue
+    reference = config.get(args.system) or {}
+    print(f"{case} ({', '.join(config['variants'])}): reference {reference.get('time')} s, {reference.get('memory')} MB")
+    first = first_label = None
+    for label, bin_dir in builds:
+        executable = os.path.join(bin_dir, config["executable"]) if bin_dir else config["executable"]
+        result = run(case, executable, args)
+        if result is None:
+            print(f"  {label}: FAILED")
+            failed.append(f"{case} {label}")
+            continue
+        time, memory = result
+        status = []
+        if reference.get("time") is not None and time > reference["time"] * (1 + tolerance):
+            status.append("time")
+        if reference.get("memory") is not None and memory > reference["memory"] * (1 + tolerance):
+            status.append("memory")
+        relative = f" ({time / first[0]:.2f}x time, {memory / first[1]:.2f}x memory of {first_label})" if first else ""
+        print(
+            f"  {label}: {time:.1f} s, {memory:.0f} MB per rank{relative}"
+            + (f" REGRESSION of the {' and '.join(status)}" if status else "")
+        )
+        if status:
+            failed.append(f"{case} {label}")
+        if first is None:
+            first, first_label = result, label
+
+if failed:
+    sys.exit(1)